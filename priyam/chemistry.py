@@ -1,6 +1,7 @@
-from typing import Dict
-import re
+from typing import Dict, Sequence
+import functools
 import math
+import sys
 
 # Minimal periodic table (extend as needed)
 PERIODIC_TABLE: Dict[str, float] = {
@@ -36,6 +37,12 @@ PERIODIC_TABLE: Dict[str, float] = {
     # Add more elements as required
 }
 
+# Interned keys let dict lookups hit the pointer-identity fast path when
+# the parser interns element substrings before looking them up.
+PERIODIC_TABLE = {sys.intern(k): v for k, v in PERIODIC_TABLE.items()}
+
+_R_GAS = 8.3145  # J/(mol K)
+
 
 class ChemistrySolver:
     """
@@ -51,10 +58,11 @@ class ChemistrySolver:
         - element symbols (1 or 2 letters)
         - integer subscripts
         - parentheses with multipliers
+
+        Results are memoized per formula string, so repeated calls
+        (e.g. stoichiometry loops over the same compound) cost a dict hit.
         """
-        tokens = _tokenize_formula(formula)
-        mass, _ = _parse_group(tokens, 0)
-        return mass
+        return _molar_mass_cached(formula)
 
     @staticmethod
     def grams_to_moles(mass_g: float, formula: str) -> float:
@@ -69,79 +77,231 @@ class ChemistrySolver:
         return moles * M
 
     @staticmethod
-    def ideal_gas_volume(n_moles: float, T_K: float, P_Pa: float) -> float:
+    def molar_mass_batch(formulas: Sequence[str]):
+        """
+        Molar masses for a sequence of formulas as a float64 numpy array.
+
+        Each distinct formula is parsed at most once (via the shared
+        cache), so columns with many repeated compounds cost one parse
+        per unique formula plus an array fill.
+        """
+        import numpy as np
+
+        out = np.empty(len(formulas), dtype=np.float64)
+        for i, formula in enumerate(formulas):
+            out[i] = _molar_mass_cached(formula)
+        return out
+
+    @staticmethod
+    def grams_to_moles_batch(mass_g, formulas: Sequence[str]):
+        """Vectorized n = m / M over parallel mass/formula sequences."""
+        import numpy as np
+
+        return np.asarray(mass_g, dtype=np.float64) / ChemistrySolver.molar_mass_batch(formulas)
+
+    @staticmethod
+    def moles_to_grams_batch(moles, formulas: Sequence[str]):
+        """Vectorized m = n M over parallel moles/formula sequences."""
+        import numpy as np
+
+        return np.asarray(moles, dtype=np.float64) * ChemistrySolver.molar_mass_batch(formulas)
+
+    @staticmethod
+    def ideal_gas_volume(n_moles: float, T_K: float, P_Pa: float, _R=_R_GAS) -> float:
         """
         Compute volume from ideal gas law: PV = nRT.
         Returns volume in m^3.
         """
-        R = 8.3145  # J/(mol K)
-        return n_moles * R * T_K / P_Pa
+        return n_moles * _R * T_K / P_Pa
+
+    @staticmethod
+    def ideal_gas_volume_batch(n_moles, T_K, P_Pa):
+        """Vectorized PV = nRT over arrays of (n, T, P) grid points."""
+        import numpy as np
+
+        n_moles = np.asarray(n_moles, dtype=np.float64)
+        T_K = np.asarray(T_K, dtype=np.float64)
+        return n_moles * _R_GAS * T_K / np.asarray(P_Pa, dtype=np.float64)
+
+
+def register_element(symbol: str, atomic_mass: float) -> None:
+    """
+    Add or update an element in PERIODIC_TABLE.
+
+    Use this instead of mutating PERIODIC_TABLE directly so the
+    molar-mass cache is invalidated along with the table.
+    """
+    PERIODIC_TABLE[sys.intern(symbol)] = atomic_mass
+    _molar_mass_cached.cache_clear()
+
+
+def warmup() -> None:
+    """
+    Pre-build the cached equilibrium residuals for common stoichiometries.
+
+    The fallback=True path of equilibrium_concentration_aA_bB_cC_dD pays
+    sympy's import and lambdify cost on first use; call this once at
+    application start (e.g. before serving requests) to front-load it.
+    """
+    for a, b, c, d in ((1, 1, 1, 1), (2, 1, 1, 2), (1, 2, 2, 1)):
+        _eq_func(a, b, c, d)
 
 
 # ---------- Internal formula parser ----------
 
-TOKEN_PATTERN = re.compile(
-    r"([A-Z][a-z]?)|(\()|(\))|(\d+)"
-)
-
-
-def _tokenize_formula(formula: str):
-    tokens = []
-    for match in TOKEN_PATTERN.finditer(formula):
-        element, lpar, rpar, number = match.groups()
-        if element:
-            tokens.append(("ELEM", element))
-        elif lpar:
-            tokens.append(("LPAR", lpar))
-        elif rpar:
-            tokens.append(("RPAR", rpar))
-        elif number:
-            tokens.append(("NUM", int(number)))
-    return tokens
-
-
-def _parse_group(tokens, i: int):
-    """
-    Recursive descent parser for group ::=
-        ( element [num] | '(' group ')' [num] )+
-    Returns (mass, new_index).
-    """
-    total_mass = 0.0
-    while i < len(tokens):
-        token_type, value = tokens[i]
-        if token_type == "ELEM":
-            elem = value
-            if elem not in PERIODIC_TABLE:
-                raise ValueError(f"Unknown element: {elem}")
-            atomic_mass = PERIODIC_TABLE[elem]
+def _molar_mass_impl(formula: str) -> float:
+    """
+    Single-pass stack evaluation of a formula's molar mass.
+
+    A hand-written scanner walks the string once (formulas have a tiny
+    alphabet, so a character scan beats the regex engine here): element
+    masses accumulate into the top of a stack of partial sums, '(' pushes
+    a new partial sum, ')' pops it and a trailing number multiplies
+    whatever was just completed (an element or a closed group).
+    """
+    stack = [0.0]
+    last_mass = 0.0  # mass of the most recent element or closed group
+    # a count may only follow an element symbol or ')'; cleared on '('
+    # and after it is consumed, so "(2H)" and "H(2O)" are rejected
+    has_multiplicand = False
+    # Hot loop: bind lookups as locals so each token avoids the
+    # LOAD_GLOBAL/LOAD_ATTR dance.
+    lookup = PERIODIC_TABLE.get
+    intern = sys.intern
+    i = 0
+    n = len(formula)
+    while i < n:
+        ch = formula[i]
+        if "A" <= ch <= "Z":
+            j = i + 1
+            if j < n and "a" <= formula[j] <= "z":
+                j += 1
+            symbol = formula[i:j]
+            last_mass = lookup(intern(symbol))
+            if last_mass is None:
+                raise ValueError(f"Unknown element: {symbol}")
+            stack[-1] += last_mass
+            has_multiplicand = True
+            i = j
+        elif "0" <= ch <= "9":
+            j = i + 1
+            while j < n and "0" <= formula[j] <= "9":
+                j += 1
+            if not has_multiplicand:
+                raise ValueError(f"Unexpected number {formula[i:j]!r} in formula.")
+            # the element/group already contributed once; add the rest
+            stack[-1] += last_mass * (int(formula[i:j]) - 1)
+            has_multiplicand = False
+            i = j
+        elif ch == "(":
+            stack.append(0.0)
+            has_multiplicand = False
             i += 1
-            # optional number
-            if i < len(tokens) and tokens[i][0] == "NUM":
-                count = tokens[i][1]
-                i += 1
-            else:
-                count = 1
-            total_mass += atomic_mass * count
-        elif token_type == "LPAR":
-            # parse sub-group
-            sub_mass, i = _parse_group(tokens, i + 1)
-            # expect closing parenthesis
-            if i >= len(tokens) or tokens[i][0] != "RPAR":
-                raise ValueError("Unmatched '(' in formula.")
+        elif ch == ")":
+            if len(stack) == 1:
+                raise ValueError("Unmatched ')' in formula.")
+            last_mass = stack.pop()
+            stack[-1] += last_mass
+            has_multiplicand = True
             i += 1
-            # optional multiplier
-            if i < len(tokens) and tokens[i][0] == "NUM":
-                mult = tokens[i][1]
-                i += 1
-            else:
-                mult = 1
-            total_mass += sub_mass * mult
-        elif token_type == "RPAR":
-            # caller is responsible for consuming RPAR
+        else:
+            raise ValueError(f"Unexpected character {ch!r} in formula.")
+    if len(stack) != 1:
+        raise ValueError("Unmatched '(' in formula.")
+    return stack[0]
+
+
+# Marks every uppercase letter with a separator so one C-level
+# translate+split yields per-element chunks like ['H2', 'O'].
+_SEGMENT = str.maketrans({c: "|" + c for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"})
+
+
+def _flat_molar_mass(formula: str) -> float:
+    """
+    Reducer for the common parenthesis-free case (H2O, NaCl, C6H12O6...).
+
+    str.translate inserts a separator before each element symbol and
+    split hands back 'Xx123' chunks, so the scanning happens in C; the
+    Python loop only splits each chunk into symbol and count.
+    """
+    total = 0.0
+    lookup = PERIODIC_TABLE.get
+    intern = sys.intern
+    parts = formula.translate(_SEGMENT).split("|")
+    if parts[0]:
+        raise ValueError(f"Unexpected character {parts[0][0]!r} in formula.")
+    for part in parts[1:]:
+        if len(part) > 1 and "a" <= part[1] <= "z":
+            symbol, count = part[:2], part[2:]
+        else:
+            symbol, count = part[:1], part[1:]
+        mass = lookup(intern(symbol))
+        if mass is None:
+            raise ValueError(f"Unknown element: {symbol}")
+        if count:
+            if not count.isdigit():
+                raise ValueError(f"Unexpected character {count.lstrip('0123456789')[0]!r} in formula.")
+            mass *= int(count)
+        total += mass
+    return total
+
+
+@functools.lru_cache(maxsize=4096)
+def _molar_mass_cached(formula: str) -> float:
+    if "(" not in formula:
+        return _flat_molar_mass(formula)
+    return _molar_mass_impl(formula)
+
+
+# ---------- Internal equilibrium helpers ----------
+
+
+@functools.lru_cache(maxsize=64)
+def _eq_func(a: int, b: int, c: int, d: int):
+    """
+    Lambdified (f, f') pair for the mass-action residual of
+    a A + b B ⇌ c C + d D, keyed on the stoichiometric coefficients so
+    repeated solves with different K / initial concentrations skip sympy.
+    """
+    import sympy
+
+    xi, K, A0, B0, C0, D0 = sympy.symbols("xi K A0 B0 C0 D0")
+    expr = (C0 + c * xi) ** c * (D0 + d * xi) ** d - K * (A0 - a * xi) ** a * (B0 - b * xi) ** b
+    return sympy.lambdify((xi, K, A0, B0, C0, D0), (expr, sympy.diff(expr, xi)), modules="math")
+
+
+def _solve_extent(f, fp, lo: float, hi: float) -> float:
+    """
+    Newton iteration for the reaction extent, safeguarded by bisection.
+
+    f is increasing on (lo, hi) with f(lo) <= 0 <= f(hi): the forward
+    direction brackets [0, xi_max) where f -> +inf as a reactant is
+    exhausted, the reverse direction (xi_min, 0] where f -> -inf as a
+    product is exhausted.
+    """
+    xi = (lo + hi) / 2
+    for _ in range(100):
+        fx = f(xi)
+        if abs(fx) < 1e-12:
             break
+        if fx > 0:
+            hi = xi
+        else:
+            lo = xi
+        dfx = fp(xi)
+        if dfx != 0:
+            xi_new = xi - fx / dfx
         else:
-            raise ValueError(f"Unexpected token {token_type} at position {i}")
-    return total_mass, i
+            xi_new = (lo + hi) / 2
+        # fall back to bisection when Newton leaves the bracket
+        if not (lo < xi_new < hi):
+            xi_new = (lo + hi) / 2
+        if abs(xi_new - xi) < 1e-14:
+            xi = xi_new
+            break
+        xi = xi_new
+    return xi
+
 
 class Equilibrium:
     """
@@ -150,26 +310,26 @@ class Equilibrium:
     """
 
     @staticmethod
-    def henderson_hasselbalch(pKa: float, base_conc: float, acid_conc: float) -> float:
+    def henderson_hasselbalch(pKa: float, base_conc: float, acid_conc: float, _log10=math.log10) -> float:
         """
         pH = pKa + log10([base]/[acid]).
         For buffer solutions (weak acid / conjugate base).
         """
         if acid_conc <= 0 or base_conc <= 0:
             raise ValueError("Concentrations must be positive.")
-        return pKa + math.log10(base_conc / acid_conc)
+        return pKa + _log10(base_conc / acid_conc)
 
     @staticmethod
-    def pH_strong_acid(C: float) -> float:
+    def pH_strong_acid(C: float, _log10=math.log10) -> float:
         """
         pH of a strong monoprotic acid: [H+] = C.
         """
         if C <= 0:
             raise ValueError("Concentration must be positive.")
-        return -math.log10(C)
+        return -_log10(C)
 
     @staticmethod
-    def pH_strong_base(C: float) -> float:
+    def pH_strong_base(C: float, _log10=math.log10) -> float:
         """
         pH of a strong monoprotic base: [OH-] = C.
         Kw = 1.0e-14 at 25°C.
@@ -178,10 +338,10 @@ class Equilibrium:
             raise ValueError("Concentration must be positive.")
         Kw = 1.0e-14
         h_plus = Kw / C
-        return -math.log10(h_plus)
+        return -_log10(h_plus)
 
     @staticmethod
-    def weak_acid_pH(C: float, Ka: float) -> float:
+    def weak_acid_pH(C: float, Ka: float, _log10=math.log10, _sqrt=math.sqrt) -> float:
         """
         Approximate pH of weak monoprotic acid HA with initial conc C:
         HA ⇌ H+ + A-
@@ -189,8 +349,40 @@ class Equilibrium:
         """
         if C <= 0 or Ka <= 0:
             raise ValueError("C and Ka must be positive.")
-        h_plus = math.sqrt(Ka * C)
-        return -math.log10(h_plus)
+        h_plus = _sqrt(Ka * C)
+        return -_log10(h_plus)
+
+    @staticmethod
+    def pH_strong_acid_batch(C):
+        """Vectorized pH_strong_acid over an array of concentrations."""
+        import numpy as np
+
+        return -np.log10(np.asarray(C, dtype=np.float64))
+
+    @staticmethod
+    def pH_strong_base_batch(C):
+        """Vectorized pH_strong_base over an array of concentrations."""
+        import numpy as np
+
+        return -np.log10(1.0e-14 / np.asarray(C, dtype=np.float64))
+
+    @staticmethod
+    def weak_acid_pH_batch(C, Ka):
+        """Vectorized weak_acid_pH over arrays of C and Ka."""
+        import numpy as np
+
+        C = np.asarray(C, dtype=np.float64)
+        Ka = np.asarray(Ka, dtype=np.float64)
+        return -0.5 * np.log10(Ka * C)
+
+    @staticmethod
+    def henderson_hasselbalch_batch(pKa, base_conc, acid_conc):
+        """Vectorized henderson_hasselbalch over parallel arrays."""
+        import numpy as np
+
+        base_conc = np.asarray(base_conc, dtype=np.float64)
+        acid_conc = np.asarray(acid_conc, dtype=np.float64)
+        return np.asarray(pKa, dtype=np.float64) + np.log10(base_conc / acid_conc)
 
     @staticmethod
     def equilibrium_concentration_aA_bB_cC_dD(
@@ -203,31 +395,61 @@ class Equilibrium:
         B0: float,
         C0: float = 0.0,
         D0: float = 0.0,
+        fallback: bool = False,
     ):
         """
         Very simple 1D extent-of-reaction approach for:
             a A + b B ⇌ c C + d D
 
-        Assumes single reaction extent ξ and uses numeric search.
+        Assumes single reaction extent ξ and finds it with a plain
+        Newton iteration (bisection-safeguarded) on the polynomial
+            f(ξ) = [C]^c [D]^d - K [A]^a [B]^b,
+        which shares its root with the mass-action equation but has no
+        denominators. Pass fallback=True to evaluate f and f' through a
+        sympy-derived (and cached) lambdify pair instead — slower on
+        first use, kept for cross-checking the hand-written derivative.
         This is illustrative and not a robust solver for all cases.
         """
-        from sympy import symbols, Eq, nsolve
+        if fallback:
+            f_fp = _eq_func(a, b, c, d)
 
-        xi = symbols("xi")
-        A = A0 - a * xi
-        B = B0 - b * xi
-        C = C0 + c * xi
-        D = D0 + d * xi
+            def f(xi):
+                return f_fp(xi, K, A0, B0, C0, D0)[0]
 
-        # Avoid division by zero: K = [C]^c [D]^d / ([A]^a [B]^b)
-        # Use symbolic equation:
-        eq = Eq((C ** c) * (D ** d) / ((A ** a) * (B ** b)), K)
+            def fp(xi):
+                return f_fp(xi, K, A0, B0, C0, D0)[1]
 
-        guess = min(A0 / max(a, 1), B0 / max(b, 1)) / 2
-        sol = nsolve(eq, xi, guess)
+        else:
+
+            def f(xi):
+                A = A0 - a * xi
+                B = B0 - b * xi
+                C = C0 + c * xi
+                D = D0 + d * xi
+                return C ** c * D ** d - K * A ** a * B ** b
 
-        A_eq = float(A.subs(xi, sol))
-        B_eq = float(B.subs(xi, sol))
-        C_eq = float(C.subs(xi, sol))
-        D_eq = float(D.subs(xi, sol))
-        return {"A": A_eq, "B": B_eq, "C": C_eq, "D": D_eq}
+            def fp(xi):
+                # Product rule; d[A]/dξ = -a, d[C]/dξ = +c, etc.
+                A = A0 - a * xi
+                B = B0 - b * xi
+                C = C0 + c * xi
+                D = D0 + d * xi
+                return (
+                    c * c * C ** (c - 1) * D ** d
+                    + d * d * C ** c * D ** (d - 1)
+                    + K * (a * a * A ** (a - 1) * B ** b + b * b * A ** a * B ** (b - 1))
+                )
+
+        # f(0) compares the initial quotient against K: positive means
+        # the products are over-represented and the reaction must run in
+        # reverse, so the extent is bracketed on the negative side.
+        if f(0.0) > 0:
+            xi = _solve_extent(f, fp, -min(C0 / max(c, 1), D0 / max(d, 1)), 0.0)
+        else:
+            xi = _solve_extent(f, fp, 0.0, min(A0 / max(a, 1), B0 / max(b, 1)))
+        return {
+            "A": A0 - a * xi,
+            "B": B0 - b * xi,
+            "C": C0 + c * xi,
+            "D": D0 + d * xi,
+        }
@@ -1,5 +1,6 @@
 from typing import Dict, List, Tuple, Any
 import heapq
+from bisect import bisect_left
 from collections import deque
 
 
@@ -14,17 +15,22 @@ class GraphAlgorithms:
     @staticmethod
     def bfs(adj: Dict[Any, List[Any]], start: Any) -> List[Any]:
         """Breadth-first traversal from start (unweighted graph)."""
-        visited = set()
+        visited = {start}
         order = []
         q = deque([start])
-        visited.add(start)
+        # Bind the hot methods once; each loop iteration otherwise pays
+        # an attribute lookup per pop/push/add.
+        popleft = q.popleft
+        push = q.append
+        mark = visited.add
+        neighbors = adj.get
         while q:
-            u = q.popleft()
+            u = popleft()
             order.append(u)
-            for v in adj.get(u, []):
+            for v in neighbors(u, ()):
                 if v not in visited:
-                    visited.add(v)
-                    q.append(v)
+                    mark(v)
+                    push(v)
         return order
 
     @staticmethod
@@ -32,15 +38,16 @@ class GraphAlgorithms:
         """Depth-first traversal from start (unweighted graph)."""
         visited = set()
         order = []
-
-        def _dfs(u):
+        stack = [start]
+        while stack:
+            u = stack.pop()
+            if u in visited:
+                continue
             visited.add(u)
             order.append(u)
-            for v in adj.get(u, []):
-                if v not in visited:
-                    _dfs(v)
-
-        _dfs(start)
+            # Push in reverse so neighbours pop in their listed order,
+            # matching the recursive traversal.
+            stack.extend(v for v in reversed(adj.get(u, [])) if v not in visited)
         return order
 
     @staticmethod
@@ -52,20 +59,83 @@ class GraphAlgorithms:
         Dijkstra's shortest paths from source in a graph with non-negative weights.
         Returns dict of distances.
         """
-        dist = {node: float("inf") for node in adj}
+        inf = float("inf")
+        dist = {node: inf for node in adj}
         dist[source] = 0.0
+        settled = set()
         pq = [(0.0, source)]
         while pq:
             d, u = heapq.heappop(pq)
-            if d > dist[u]:
+            # A vertex settles on its first pop; every later heap entry
+            # for it is stale and skipped without touching dist.
+            if u in settled:
                 continue
+            settled.add(u)
             for v, w in adj.get(u, []):
                 nd = d + w
-                if nd < dist.get(v, float("inf")):
+                if nd < dist.get(v, inf):
                     dist[v] = nd
                     heapq.heappush(pq, (nd, v))
         return dist
 
+    @staticmethod
+    def dijkstra_delta(
+        adj: Dict[Any, List[Tuple[Any, float]]],
+        source: Any,
+        delta: float = 1.0
+    ) -> Dict[Any, float]:
+        """
+        Delta-stepping shortest paths (Meyer & Sanders) from source.
+
+        Tentative distances are grouped into buckets of width delta.
+        The smallest non-empty bucket is drained by relaxing light
+        edges (w <= delta) — which can only re-insert into the current
+        bucket — and heavy edges are relaxed once per settled vertex
+        afterwards. This trades the O(E log V) heap traffic of
+        dijkstra for O(E + buckets) set operations, which wins on
+        low-diameter graphs with many same-magnitude weights.
+        Same non-negative-weight requirement as dijkstra.
+        """
+        inf = float("inf")
+        dist = {node: inf for node in adj}
+        dist[source] = 0.0
+        buckets: Dict[int, set] = {0: {source}}
+
+        def _relax(v, nd):
+            old = dist.get(v, inf)
+            if nd < old:
+                if old != inf:
+                    stale = buckets.get(int(old // delta))
+                    if stale is not None:
+                        stale.discard(v)
+                dist[v] = nd
+                buckets.setdefault(int(nd // delta), set()).add(v)
+
+        while buckets:
+            i = min(buckets)
+            settled = set()
+            # Light edges may refill bucket i; keep draining until it
+            # stays empty.
+            while i in buckets:
+                frontier = buckets.pop(i)
+                if not frontier:
+                    continue
+                requests = []
+                for u in frontier:
+                    settled.add(u)
+                    du = dist[u]
+                    for v, w in adj.get(u, []):
+                        if w <= delta:
+                            requests.append((v, du + w))
+                for v, nd in requests:
+                    _relax(v, nd)
+            for u in settled:
+                du = dist[u]
+                for v, w in adj.get(u, []):
+                    if w > delta:
+                        _relax(v, du + w)
+        return dist
+
     @staticmethod
     def topological_sort(adj: Dict[Any, List[Any]]) -> List[Any]:
         """
@@ -103,20 +173,25 @@ class SearchingSorting:
         """
         Return index of target in sorted arr, or -1 if not found.
         """
-        lo, hi = 0, len(arr) - 1
-        while lo <= hi:
-            mid = (lo + hi) // 2
-            if arr[mid] == target:
-                return mid
-            elif arr[mid] < target:
-                lo = mid + 1
-            else:
-                hi = mid - 1
-        return -1
+        i = bisect_left(arr, target)
+        return i if i < len(arr) and arr[i] == target else -1
 
     @staticmethod
     def quicksort(arr: List[Any]) -> List[Any]:
-        """In-place quicksort wrapper (returns the same list)."""
+        """
+        Sort arr in place and return it.
+
+        Delegates to the C-implemented built-in sort (Timsort for
+        lists, introsort for numpy arrays — both take the same call);
+        the pedagogical recursive version is kept as
+        _quicksort_reference.
+        """
+        arr.sort()
+        return arr
+
+    @staticmethod
+    def _quicksort_reference(arr: List[Any]) -> List[Any]:
+        """In-place quicksort reference implementation (returns the same list)."""
         def _qs(a, lo, hi):
             if lo >= hi:
                 return
@@ -139,27 +214,45 @@ class SearchingSorting:
 
     @staticmethod
     def mergesort(arr: List[Any]) -> List[Any]:
+        """
+        Return a sorted copy of arr.
+
+        Delegates to the built-in stable sorted(); the pedagogical
+        recursive version is kept as _mergesort_reference.
+        """
+        return sorted(arr)
+
+    @staticmethod
+    def _mergesort_reference(arr: List[Any]) -> List[Any]:
         """Return a new list containing a sorted copy using mergesort."""
         if len(arr) <= 1:
             return arr[:]
         mid = len(arr) // 2
-        left = SearchingSorting.mergesort(arr[:mid])
-        right = SearchingSorting.mergesort(arr[mid:])
+        left = SearchingSorting._mergesort_reference(arr[:mid])
+        right = SearchingSorting._mergesort_reference(arr[mid:])
         return SearchingSorting._merge(left, right)
 
     @staticmethod
     def _merge(left: List[Any], right: List[Any]) -> List[Any]:
-        i = j = 0
-        out = []
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                out.append(left[i])
+        nl, nr = len(left), len(right)
+        # Preallocate and assign by index: no amortized-resize checks
+        # on the append path.
+        out = [None] * (nl + nr)
+        i = j = k = 0
+        while i < nl and j < nr:
+            lv = left[i]
+            rv = right[j]
+            if lv <= rv:
+                out[k] = lv
                 i += 1
             else:
-                out.append(right[j])
+                out[k] = rv
                 j += 1
-        out.extend(left[i:])
-        out.extend(right[j:])
+            k += 1
+        if i < nl:
+            out[k:] = left[i:]
+        else:
+            out[k:] = right[j:]
         return out
 
 
@@ -204,15 +297,16 @@ class DynamicProgramming:
         Returns maximum achievable value.
         Time: O(n * capacity).
         """
-        n = len(weights)
-        dp = [0] * (capacity + 1)
-        for i in range(n):
-            w = weights[i]
-            v = values[i]
-            # iterate backwards for 0/1
-            for c in range(capacity, w - 1, -1):
-                dp[c] = max(dp[c], dp[c - w] + v)
-        return dp[capacity]
+        import numpy as np
+
+        dp = np.zeros(capacity + 1, dtype=np.int64)
+        for w, v in zip(weights, values):
+            if w > capacity:
+                continue
+            # The right-hand side is evaluated against the pre-update
+            # row, which is exactly the 0/1 reverse-iteration semantics.
+            np.maximum(dp[w:], dp[:capacity + 1 - w] + v, out=dp[w:])
+        return int(dp[capacity])
 
     @staticmethod
     def longest_increasing_subsequence(arr: List[int]) -> int:
@@ -220,15 +314,17 @@ class DynamicProgramming:
         LIS in O(n log n).
         Returns length of LIS.
         """
-        import bisect
         tails: List[int] = []
+        append = tails.append
+        k = 0
         for x in arr:
-            idx = bisect.bisect_left(tails, x)
-            if idx == len(tails):
-                tails.append(x)
+            idx = bisect_left(tails, x, 0, k)
+            if idx == k:
+                append(x)
+                k += 1
             else:
                 tails[idx] = x
-        return len(tails)
+        return k
 
     @staticmethod
     def edit_distance(s1: str, s2: str) -> int:
@@ -236,22 +332,32 @@ class DynamicProgramming:
         Levenshtein edit distance DP.
         """
         m, n = len(s1), len(s2)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-        for i in range(m + 1):
-            dp[i][0] = i
-        for j in range(n + 1):
-            dp[0][j] = j
+        if n > m:
+            # Roll over the shorter string to keep the rows small.
+            s1, s2, m, n = s2, s1, n, m
 
+        # Two rolling rows instead of the full (m+1)x(n+1) table:
+        # O(n) memory, and each cell is a few local-variable ops.
+        prev = list(range(n + 1))
+        curr = [0] * (n + 1)
         for i in range(1, m + 1):
+            c1 = s1[i - 1]
+            curr[0] = i
+            left = i
             for j in range(1, n + 1):
-                cost = 0 if s1[i - 1] == s2[j - 1] else 1
-                dp[i][j] = min(
-                    dp[i - 1][j] + 1,      # deletion
-                    dp[i][j - 1] + 1,      # insertion
-                    dp[i - 1][j - 1] + cost  # substitution
-                )
-        return dp[m][n]
+                up = prev[j]
+                diag = prev[j - 1]
+                if c1 != s2[j - 1]:
+                    diag += 1
+                best = diag
+                if up + 1 < best:
+                    best = up + 1
+                if left + 1 < best:
+                    best = left + 1
+                curr[j] = best
+                left = best
+            prev, curr = curr, prev
+        return prev[n]
 
 
 class GreedyPatterns:
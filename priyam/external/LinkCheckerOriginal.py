@@ -1,6 +1,7 @@
 import threading
+import queue
 import concurrent.futures
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlunparse
 import csv
 import requests
 from bs4 import BeautifulSoup
@@ -8,6 +9,15 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from playwright.sync_api import sync_playwright
 
+# lxml's C parser is several times faster than the pure-Python
+# html.parser on big rendered pages; fall back when it isn't installed.
+try:
+    import lxml  # noqa: F401
+    SOUP_PARSER = "lxml"
+except ImportError:
+    SOUP_PARSER = "html.parser"
+
+
 def create_session():
     session = requests.Session()
     session.headers.update({
@@ -17,13 +27,19 @@ def create_session():
             "Chrome/123.0 Safari/537.36"
         )
     })
+    # Size the connection pool for the checker's worker count so
+    # keep-alive sockets actually get reused under full concurrency.
+    adapter = requests.adapters.HTTPAdapter(pool_connections=50, pool_maxsize=50)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     return session
 
 
 def get_rendered_html_js(url: str, timeout_ms: int = 30000) -> str:
     """
     Use Playwright (Chromium) to fully render JS-heavy pages (React, Next.js, etc.)
-    and return the final HTML.
+    and return the final HTML. One-shot: launches and closes a browser
+    per call — inside the app, PlaywrightPool amortizes that cost.
     """
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
@@ -34,6 +50,50 @@ def get_rendered_html_js(url: str, timeout_ms: int = 30000) -> str:
     return html
 
 
+class PlaywrightPool:
+    """
+    Lazily-launched shared Chromium instance. A browser launch costs
+    about a second; rendering in a fresh context on an already-running
+    browser costs tens of milliseconds, so the launch is paid once and
+    reused until close(). Playwright's sync API is bound to the thread
+    that started it, and every check runs on a new worker thread, so
+    all browser work funnels through a dedicated single-thread
+    executor.
+    """
+
+    def __init__(self):
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._pw = None
+        self._browser = None
+
+    def render(self, url: str, timeout_ms: int = 30000) -> str:
+        return self._executor.submit(self._render, url, timeout_ms).result()
+
+    def _render(self, url: str, timeout_ms: int) -> str:
+        if self._browser is None:
+            self._pw = sync_playwright().start()
+            self._browser = self._pw.chromium.launch(headless=True)
+        context = self._browser.new_context()
+        try:
+            page = context.new_page()
+            page.goto(url, wait_until="networkidle", timeout=timeout_ms)
+            return page.content()
+        finally:
+            context.close()
+
+    def close(self):
+        self._executor.submit(self._close).result()
+        self._executor.shutdown(wait=False)
+
+    def _close(self):
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
+
+
 def get_raw_html(url: str, session: requests.Session, timeout: int = 20) -> str:
     resp = session.get(url, timeout=timeout)
     resp.raise_for_status()
@@ -56,8 +116,19 @@ def is_http_url(href: str) -> bool:
     return False
 
 
+def normalize_url(url: str) -> str:
+    """
+    Canonical form for deduplication: case-folded scheme and host,
+    '/' for an empty path, fragment dropped. https://X/a and
+    https://x/a#top are one request, not two.
+    """
+    p = urlparse(url)
+    return urlunparse((p.scheme.lower(), p.netloc.lower(), p.path or "/",
+                       p.params, p.query, ""))
+
+
 def extract_links(html: str, base_url: str):
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, SOUP_PARSER)
     links = set()
     raw_count = 0
 
@@ -66,18 +137,18 @@ def extract_links(html: str, base_url: str):
         raw_count += 1
         if not is_http_url(raw_href):
             continue
-        abs_url = urljoin(base_url, raw_href)
+        abs_url = normalize_url(urljoin(base_url, raw_href))
         links.add(abs_url)
     return sorted(links), raw_count
 
 
-def check_link(url: str, timeout: int = 10):
+def check_link(url: str, session: requests.Session, timeout: int = 10):
     """
     Returns (url, is_broken, info_string).
     is_broken: True if HTTP status >= 400 or request fails.
     info_string: status or error message.
+    The caller's session is reused so connections stay pooled.
     """
-    session = create_session()
     try:
         try:
             resp = session.head(url, allow_redirects=True, timeout=timeout)
@@ -103,9 +174,18 @@ class LinkCheckerApp:
         self.root.geometry("1000x650")
 
         self.session = create_session()
-        self.results = [] 
+        self.results = []
+        # url -> (is_broken, info); repeated runs skip the network for
+        # links already checked this session
+        self._check_cache = {}
+        self._pw_pool = PlaywrightPool()
+        # workers post status/progress here; a 10 Hz Tk callback applies
+        # only the newest of each instead of one event per completed link
+        self._msg_q = queue.Queue()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.build_ui()
+        self.root.after(100, self._drain_queue)
 
     def build_ui(self):
         # dark mode thing
@@ -248,7 +328,7 @@ class LinkCheckerApp:
         try:
             self.update_status("Fetching page HTML...")
             if use_js:
-                html = get_rendered_html_js(url)
+                html = self._pw_pool.render(url)
             else:
                 html = get_raw_html(url, self.session)
 
@@ -262,20 +342,33 @@ class LinkCheckerApp:
 
             self.update_status(f"Found {total_links} checkable links (raw <a> tags: {raw_count}). Checking...")
             results = []
-
-            # multithreaded checking
-            max_workers = min(20, max(4, total_links // 2))
-            completed = 0
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_url = {executor.submit(check_link, link): link for link in links}
-                for future in concurrent.futures.as_completed(future_to_url):
-                    url_res, is_broken, info = future.result()
-                    results.append((url_res, is_broken, info))
-                    completed += 1
-                    progress = (completed / total_links) * 100
-                    self.update_progress(progress)
-                    self.update_status(f"Checking links... {completed}/{total_links}")
+            to_check = []
+            for link in links:
+                cached = self._check_cache.get(link)
+                if cached is not None:
+                    results.append((link, cached[0], cached[1]))
+                else:
+                    to_check.append(link)
+            completed = len(results)
+
+            if to_check:
+                # multithreaded checking: the work is pure I/O wait, so one
+                # thread per link up to a generous cap beats the old cap of 20
+                max_workers = min(50, max(4, len(to_check)))
+
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    future_to_url = {
+                        executor.submit(check_link, link, self.session): link
+                        for link in to_check
+                    }
+                    for future in concurrent.futures.as_completed(future_to_url):
+                        url_res, is_broken, info = future.result()
+                        self._check_cache[url_res] = (is_broken, info)
+                        results.append((url_res, is_broken, info))
+                        completed += 1
+                        progress = (completed / total_links) * 100
+                        self.update_progress(progress)
+                        self.update_status(f"Checking links... {completed}/{total_links}")
 
             self.root.after(0, lambda: self.display_results(results))
         except Exception as e:
@@ -366,32 +459,55 @@ class LinkCheckerApp:
     def sort_by_column(self, col):
         reverse = self._sort_state.get(col, False)
         data = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-        try:
-            data.sort(key=lambda t: float(self._safe_num(t[0])), reverse=reverse)
-        except ValueError:
-            data.sort(key=lambda t: t[0].lower() if isinstance(t[0], str) else t[0], reverse=reverse)
+
+        # Numeric cells sort before (and among) themselves, everything
+        # else case-insensitively — one sort, no exception-driven retry.
+        def _key(value):
+            try:
+                return (0, float(value), "")
+            except ValueError:
+                return (1, 0.0, value.lower())
+
+        data.sort(key=lambda t: _key(t[0]), reverse=reverse)
 
         for index, (_, k) in enumerate(data):
             self.tree.move(k, "", index)
 
         self._sort_state[col] = not reverse
 
-    @staticmethod
-    def _safe_num(value):
-        s = "".join(ch for ch in str(value) if (ch.isdigit() or ch == "."))
-        if not s:
-            raise ValueError
-        return s
-
     def update_status(self, text: str):
-        self.root.after(0, lambda: self.status_var.set(text))
+        self._msg_q.put(("status", text))
 
     def update_progress(self, value: float):
-        self.root.after(0, lambda: self.progress_var.set(value))
+        self._msg_q.put(("progress", value))
+
+    def _drain_queue(self):
+        status = progress = None
+        while True:
+            try:
+                kind, value = self._msg_q.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "status":
+                status = value
+            else:
+                progress = value
+        if status is not None:
+            self.status_var.set(status)
+        if progress is not None:
+            self.progress_var.set(progress)
+        self.root.after(100, self._drain_queue)
 
     def enable_start_button(self):
         self.root.after(0, lambda: self.start_button.config(state=tk.NORMAL))
 
+    def _on_close(self):
+        try:
+            self._pw_pool.close()
+        except Exception:
+            pass
+        self.root.destroy()
+
 
 def main():
     root = tk.Tk()
@@ -4,29 +4,58 @@ import tempfile
 import uuid
 import json
 import time
-import webbrowser
 import re
 import platform
+import types
+import difflib
+import itertools
+import threading
+import queue
+import bisect
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque, OrderedDict
 from functools import partial
 
 # --- UI toolkits ---
 import tkinter as tk
-from tkinter import filedialog, messagebox, colorchooser, simpledialog, font, ttk
+# colorchooser / simpledialog / webbrowser are imported lazily at their
+# call sites — they're dialog-only and not needed to get the window up.
+from tkinter import filedialog, messagebox, font, ttk
 
 try:
     import customtkinter as ctk
 except Exception:
     ctk = None  # We'll gracefully fall back to Tk/ttk if CustomTkinter isn't available
 
+try:
+    import orjson
+except Exception:
+    orjson = None  # stdlib json works fine, orjson is just faster
+
+
+def _dumps_index(obj):
+    # autosave index serialization: orjson when available, compact
+    # stdlib json otherwise
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
 # =======================
 # Config
 # =======================
 APP_NAME = "Texter: Open-Source Text Editor"
 AUTOSAVE_INTERVAL_MS = 30_000  # autosave every 30 seconds
 AUTOSAVE_PREFIX = "advanced_text_editor_autosave_"
+AUTOSAVE_INDEX_NAME = AUTOSAVE_PREFIX + "index.json"
 AUTOSAVE_META_EXT = ".meta.json"
+# Tk text tags are costly to keep around (every tag slows tag lookup and
+# redraw), so live color_* tags per tab are capped and LRU-evicted.
+MAX_COLOR_TAGS = 32
 
-SUPPORTED_ENCODINGS = [
+# Read-only config: tuples / a mapping proxy so UI code can't mutate
+# them by accident and iteration stays as cheap as possible.
+SUPPORTED_ENCODINGS = (
     "utf-8",
     "utf-8-sig",
     "utf-16",
@@ -34,9 +63,9 @@ SUPPORTED_ENCODINGS = [
     "utf-16-be",
     "latin-1",
     "cp1252",
-]
+)
 
-HEADING_SIZES = {
+HEADING_SIZES = types.MappingProxyType({
     "Normal": 0,
     "H1": 26,
     "H2": 22,
@@ -45,9 +74,35 @@ HEADING_SIZES = {
     "H5": 16,
     "H6": 14,
     "H7": 13,
+})
+
+FONT_SIZE_OPTIONS = (8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 28, 32, 36, 48, 64, 72)
+
+_WORD_RE = re.compile(r"\S+")
+
+# Unique suffixes for the Tk marks anchoring link endpoints; mark names
+# are widget-global, so one app-wide counter keeps them collision-free.
+_LINK_IDS = itertools.count(1)
+# an existing bullet / number prefix (possibly absent) at line start
+_BULLET_RE = re.compile(r"^(\s*(?:[\-\*•]|\d+\.)\s+)?")
+
+# all 8 combination tag names -> (bold, italic, underline), so style
+# tags are recognised and decoded by dict lookup, not string slicing
+_STYLE_BITS = {
+    f"style_{b}{i}{u}": (b == "1", i == "1", u == "1")
+    for b in "01" for i in "01" for u in "01"
 }
 
-FONT_SIZE_OPTIONS = [8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 28, 32, 36, 48, 64, 72]
+# font.families() round-trips to Tk and is slow on first call; resolved
+# once (after a Tk root exists) and shared by every consumer.
+_FAMILIES_CACHE = None
+
+
+def get_families():
+    global _FAMILIES_CACHE
+    if _FAMILIES_CACHE is None:
+        _FAMILIES_CACHE = tuple(sorted(font.families()))
+    return _FAMILIES_CACHE
 
 # Platform-appropriate modifier (for bindings) and label accelerator
 IS_MAC = platform.system() == "Darwin"
@@ -58,20 +113,98 @@ ACCEL = "⌘" if IS_MAC else "Ctrl"
 # Data Structures
 # =======================
 class TabData:
+    # One instance per open tab and its fields are touched on every
+    # keystroke (history/typing_style), so skip the per-instance __dict__.
+    __slots__ = (
+        "_frame_ref",
+        "_text_ref",
+        "file_path",
+        "autosave_id",
+        "encoding",
+        "history",
+        "future",
+        "last_snapshot_state",
+        "word_count",
+        "char_count",
+        "typing_style",
+        "dirty",
+        "color_tags",
+        "search_hits",
+        "search_lines",
+        "link_ranges",
+    )
+
     def __init__(self, frame, text_widget, file_path=None, autosave_id=None, encoding="utf-8"):
-        self.frame = frame
-        self.text = text_widget
+        # Weak: the Tk widget tree owns the widgets. Holding them weakly
+        # means a destroyed tab's frame really becomes garbage, which is
+        # what lets the app's WeakKeyDictionary of tabs self-clean.
+        self._frame_ref = weakref.ref(frame)
+        self._text_ref = weakref.ref(text_widget)
         self.file_path = file_path
         self.autosave_id = autosave_id or str(uuid.uuid4())
         self.encoding = encoding
-        # formatting-aware history (content + tags)
-        self.history = []
-        self.future = []
-        self.last_snapshot_serial = None
+        # formatting-aware history (content + tags), stored as bounded
+        # stacks of invertible deltas against the latest snapshot
+        self.history = deque(maxlen=200)
+        self.future = deque(maxlen=200)
+        self.last_snapshot_state = None
+        # status-bar counters, maintained by the snapshot path so the
+        # status bar never has to re-read the buffer
+        self.word_count = 0
+        self.char_count = 0
+        # set on <<Modified>>, cleared when an autosave write is queued;
+        # clean tabs are skipped entirely by the autosave tick
+        self.dirty = False
+        # color_* tags configured on this widget, LRU-ordered so the
+        # least recently used one can be evicted at the cap
+        self.color_tags = OrderedDict()
+        # find results as (line, start, end), with a parallel line list
+        # for bisecting the visible slice; only that slice gets tagged
+        self.search_hits = []
+        self.search_lines = []
+        # (start_mark, end_mark, url): one shared "link" tag styles
+        # every link, the target URL lives here, and Tk marks anchor
+        # the endpoints so edits elsewhere move them with the text —
+        # without growing one Tk tag per URL
+        self.link_ranges = []
 
         # For typing: a tuple (bold, italic, underline) controlling new characters
         self.typing_style = (False, False, False)
 
+    @property
+    def frame(self):
+        return self._frame_ref()
+
+    @property
+    def text(self):
+        return self._text_ref()
+
+def _content_delta(new, old):
+    """
+    Changed spans that turn `new` back into `old`: a list of
+    (start, end, replacement) over `new`, ascending and non-overlapping.
+    Storing only these spans keeps undo memory proportional to the edit,
+    not to the document.
+    """
+    ops = []
+    matcher = difflib.SequenceMatcher(None, new, old, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            ops.append((i1, i2, old[j1:j2]))
+    return ops
+
+
+def _apply_delta(content, ops):
+    parts = []
+    last = 0
+    for i1, i2, repl in ops:
+        parts.append(content[last:i1])
+        parts.append(repl)
+        last = i2
+    parts.append(content[last:])
+    return "".join(parts)
+
+
 # =======================
 # Main App
 # =======================
@@ -117,14 +250,33 @@ class AdvancedEditor:
         self.statusbar.grid(row=2, column=0, sticky="ew", padx=10, pady=(6, 10))
 
         # --- State ---
-        self.tabs = {}  # frame -> TabData
-        self.current_font_family = tk.StringVar(value="Inter" if "Inter" in font.families() else "Helvetica")
+        # frame -> TabData; weak keys so a destroyed tab drops its entry
+        # (and its tag tables) without an explicit del on every path
+        self.tabs = weakref.WeakKeyDictionary()
+        self.current_font_family = tk.StringVar(value=self._detect_default_family())
         self.base_font_size = tk.IntVar(value=13)
         self.wrap_on = tk.BooleanVar(value=True)
 
         # A cache of style tags for bold/italic/underline combinations
         # key: (bold:bool, italic:bool, underline:bool) -> tagname str
         self.style_tag_cache = {}
+        # the style_* tag names ever created (at most 8), so range clears
+        # never have to walk a widget's full tag list
+        self._style_tag_names = set()
+
+        # pending after() ids for the debounced status-bar recount and
+        # history snapshot
+        self._status_after_id = None
+        self._snap_after_id = None
+        self._snapshot_pending = False
+
+        # current tab, maintained by <<NotebookTabChanged>> so hot paths
+        # skip the select()/nametowidget round-trips
+        self._current_td = None
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # Shared named fonts (one Tcl registration per role, not per tab)
+        self._init_named_fonts()
 
         # Menus and toolbar
         self._build_menus()
@@ -144,9 +296,12 @@ class AdvancedEditor:
         # Start with a tab
         self._create_tab()
 
-        # Autosave
+        # Autosave: the recovery scan reads tempdir + N json files, so it
+        # runs on a worker thread after the first paint
         self.autosave_dir = tempfile.gettempdir()
-        self._recover_autosaves_on_startup()
+        self._autosave_index = {}  # autosave_id -> meta, mirrored to one json file
+        self._autosave_executor = ThreadPoolExecutor(max_workers=1)
+        self.root.after(0, self._kick_recovery)
         self._schedule_autosave()
 
     # ---------- Dark ttk theme (fallback if CTk not available) ----------
@@ -226,14 +381,31 @@ class AdvancedEditor:
             ),
         )
 
+    @staticmethod
+    def _detect_default_family():
+        # Cheaper than enumerating font.families() on the init path: ask
+        # Tk what one candidate font actually resolves to.
+        try:
+            return "Inter" if font.Font(family="Inter").actual("family") == "Inter" else "Helvetica"
+        except tk.TclError:
+            return "Helvetica"
+
+    def _populate_families_once(self):
+        # Deferred: sorting and marshalling the full font list into Tk is
+        # paid the first time the dropdown opens, not at startup.
+        if not self._families_populated:
+            self._families_populated = True
+            self.family_combo["values"] = get_families()
+
     def _build_toolbar(self):
         # Font family
-        families = sorted(list(font.families()))
         family_label = (ctk.CTkLabel(self.toolbar, text="Font") if self.using_ctk
                         else ttk.Label(self.toolbar, text="Font"))
         family_label.grid(row=0, column=0, padx=(6, 6), pady=4, sticky="w")
 
-        self.family_combo = ttk.Combobox(self.toolbar, values=families, width=18, state="readonly")
+        self._families_populated = False
+        self.family_combo = ttk.Combobox(self.toolbar, values=[self.current_font_family.get()],
+                                         width=18, state="readonly", postcommand=self._populate_families_once)
         self.family_combo.set(self.current_font_family.get())
         self.family_combo.bind("<<ComboboxSelected>>", lambda e: self._set_font_family(self.family_combo.get()))
         self.family_combo.grid(row=0, column=1, padx=(0, 10), pady=4, sticky="w")
@@ -329,16 +501,16 @@ class AdvancedEditor:
         )
         text.pack(fill="both", expand=True, padx=2, pady=2)
 
-        # Base font
-        base_font = font.Font(family=self.current_font_family.get(), size=self.base_font_size.get())
-        text.configure(font=base_font, spacing1=2, spacing2=2, spacing3=4)
+        # Base font: all tabs reference the same named font, so a family
+        # or size change retunes every tab in one configure call
+        text.configure(font="app_base", spacing1=2, spacing2=2, spacing3=4)
 
         # Headings (paragraph-level)
-        for name, sz in HEADING_SIZES.items():
+        for name in HEADING_SIZES:
             if name == "Normal":
                 continue
             tagname = name.lower()
-            text.tag_configure(tagname, font=font.Font(family=self.current_font_family.get(), size=sz, weight="bold"))
+            text.tag_configure(tagname, font=f"app_{tagname}")
 
         # Hyperlink tag (visual style only; per-URL tag holds target)
         text.tag_configure("link", foreground="#7aa2ff", underline=1)
@@ -348,19 +520,23 @@ class AdvancedEditor:
 
         # find highlight
         text.tag_configure("highlight", background="#ffe083", foreground="#000000")
+        text.configure(yscrollcommand=partial(self._on_text_scrolled, text))
 
         text.insert("1.0", content)
-        text.bind("<KeyRelease>", self._on_text_change)
+        # one KeyRelease handler: status refresh + history snapshot (the
+        # old second bind silently replaced the first)
+        text.bind("<KeyRelease>", self._on_key_release)
         text.bind("<ButtonRelease>", self._update_status)
         text.bind("<<Modified>>", self._on_modified_apply_typing_style)
 
-        # snapshot hooks to include formatting in history
-        text.bind("<KeyRelease>", lambda e: self._snapshot_state())
-
         tab_id = self.notebook.add(frame, text=title if not recovered else f"Recovered - {title}")
         td = TabData(frame, text, file_path=file_path, autosave_id=autosave_id, encoding=encoding)
+        text._td = td  # backref for per-keystroke handlers
         self.tabs[frame] = td
         self.notebook.select(frame)
+        # select() notifies via <<NotebookTabChanged>> only once the event
+        # loop spins, but callers below need the fresh tab immediately
+        self._current_td = td
 
         # first snapshot
         self._snapshot_state(force=True)
@@ -377,8 +553,8 @@ class AdvancedEditor:
             if messagebox.askyesno("Close tab", "Close this tab? Unsaved changes will be lost."):
                 self._remove_autosave_file(td)
                 self.notebook.forget(frame)
-                del self.tabs[frame]
-                if not self.tabs:
+                frame.destroy()  # weak tabs entry follows the widget
+                if not self.notebook.tabs():
                     self._create_tab()
 
     def _close_other_tabs(self):
@@ -393,7 +569,7 @@ class AdvancedEditor:
             if td:
                 self._remove_autosave_file(td)
                 self.notebook.forget(frame)
-                del self.tabs[frame]
+                frame.destroy()
 
     def _new_tab(self, event=None):
         self._create_tab()
@@ -424,7 +600,7 @@ class AdvancedEditor:
         if not td:
             return
         if td.file_path:
-            self._write_file(td.file_path, td.text.get("1.0", "end-1c"), td.encoding)
+            self._write_file(td.file_path, td.text, td.encoding)
             self._update_tab_title(td)
         else:
             self._save_current_tab_as()
@@ -440,7 +616,7 @@ class AdvancedEditor:
         if not path:
             return
         enc = td.encoding or self.encoding_var.get()
-        self._write_file(path, td.text.get("1.0", "end-1c"), enc)
+        self._write_file(path, td.text, enc)
         td.file_path = path
         self._update_tab_title(td)
         self._remove_autosave_file(td)  # clear autosave metadata since user saved
@@ -460,7 +636,7 @@ class AdvancedEditor:
             return
         td.encoding = enc
         self.encoding_var.set(enc)
-        self._write_file(path, td.text.get("1.0", "end-1c"), enc)
+        self._write_file(path, td.text, enc)
         td.file_path = path
         self._update_tab_title(td)
         self._remove_autosave_file(td)
@@ -486,11 +662,27 @@ class AdvancedEditor:
         self.root.wait_window(d)
         return chosen["value"]
 
-    def _write_file(self, path, data, encoding):
+    @staticmethod
+    def _iter_text_chunks(text, lines=2000):
+        # Pull the buffer out in line-range slices so saving never holds
+        # the whole document as one extra Python string.
+        last = int(text.index("end-1c").split(".")[0])
+        for i in range(1, last + 1, lines):
+            end = min(i + lines, last + 1)
+            yield text.get(f"{i}.0", f"{end}.0" if end <= last else "end-1c")
+
+    def _write_file(self, path, source, encoding):
         try:
-            with open(path, "w", encoding=encoding, newline="\n") as f:
-                f.write(data)
-            messagebox.showinfo("Saved", f"Saved to {path} ({encoding})")
+            # 1MB buffer lets the OS coalesce the chunked writes; success
+            # goes to the status bar instead of a modal popup per save
+            with open(path, "w", encoding=encoding, newline="\n", buffering=1 << 20) as f:
+                if isinstance(source, str):
+                    f.write(source)
+                else:
+                    for chunk in self._iter_text_chunks(source):
+                        f.write(chunk)
+            self.status.set(f"Saved to {path} ({encoding})")
+            self.root.after(2000, self._update_status)
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save file:\n{e}")
 
@@ -498,47 +690,78 @@ class AdvancedEditor:
         title = os.path.basename(td.file_path) if td.file_path else "Untitled"
         self.notebook.tab(td.frame, text=title)
 
-    def _get_current_tabdata(self):
+    def _on_tab_changed(self, event=None):
+        # resolve select() -> widget name -> frame once per tab switch
+        # instead of on every keystroke handler
         sel = self.notebook.select()
-        if not sel:
-            return None
-        frame = self.root.nametowidget(sel)
-        return self.tabs.get(frame)
+        self._current_td = self.tabs.get(self.root.nametowidget(sel)) if sel else None
+
+    def _get_current_tabdata(self):
+        return self._current_td
 
     # ---------- Status bar ----------
     def _update_status(self, event=None):
+        self._status_after_id = None
         td = self._get_current_tabdata()
         if not td:
             self.status.set("")
             return
         cursor_pos = td.text.index(tk.INSERT)
         row, col = cursor_pos.split(".")
-        content = td.text.get("1.0", "end-1c")
-        words = len(re.findall(r"\S+", content))
-        chars = len(content)
+        # the word counter is maintained by the snapshot path; chars come
+        # from Tk's own count, so neither needs the buffer marshalled out
+        words = td.word_count
+        try:
+            counted = td.text.count("1.0", "end-1c", "chars")
+            chars = counted[0] if counted else 0
+            td.char_count = chars
+        except tk.TclError:  # older Tk without count
+            chars = td.char_count
         tab_title = os.path.basename(td.file_path) if td.file_path else self.notebook.tab(td.frame, option="text")
         self.status.set(f"{tab_title}  •  Ln {row}  •  Col {int(col)+1}  •  Words {words}  •  Chars {chars}")
 
     def _on_text_change(self, event=None):
-        self._update_status()
+        # Debounced: the word/char recount scans the buffer, so coalesce
+        # bursts of keystrokes and recount once the user pauses.
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+        self._status_after_id = self.root.after(150, self._update_status)
+
+    def _on_key_release(self, event=None):
+        self._schedule_snapshot()
+        self._on_text_change(event)
+
+    def _schedule_snapshot(self):
+        # Snapshotting captures the whole buffer; during sustained typing
+        # coalesce to one capture per 500 ms pause.
+        if self._snap_after_id is not None:
+            self.root.after_cancel(self._snap_after_id)
+        self._snap_after_id = self.root.after(500, self._snapshot_state)
 
     # When Tk marks the text widget modified, apply typing style to the last inserted char if needed
     def _on_modified_apply_typing_style(self, event=None):
-        td = self._get_current_tabdata()
-        if not td:
+        # runs on every keystroke: resolve the tab straight off the
+        # widget and bail before any further Tk round-trips when no
+        # typing style is active (the common case)
+        td = getattr(event.widget, "_td", None) if event is not None else self._get_current_tabdata()
+        if td is None:
             return
         text = td.text
-        if text.edit_modified():
-            try:
-                insert_index = text.index(tk.INSERT)
-                last_index = f"{insert_index}-1c"
-                if text.get(last_index, insert_index) and text.compare(last_index, "<", insert_index):
-                    if td.typing_style != (False, False, False):
-                        tagname = self._ensure_style_tag(*td.typing_style)
-                        text.tag_add(tagname, last_index, insert_index)
-            except Exception:
-                pass
+        if not text.edit_modified():
+            return
+        td.dirty = True
+        if td.typing_style == (False, False, False):
             text.edit_modified(False)
+            return
+        try:
+            insert_index = text.index(tk.INSERT)
+            last_index = f"{insert_index}-1c"
+            if text.get(last_index, insert_index) and text.compare(last_index, "<", insert_index):
+                tagname = self._ensure_style_tag(*td.typing_style)
+                text.tag_add(tagname, last_index, insert_index)
+        except Exception:
+            pass
+        text.edit_modified(False)
 
     def _focus_text_safely(self):
         td = self._get_current_tabdata()
@@ -547,59 +770,102 @@ class AdvancedEditor:
 
     # ---------- Autosave ----------
     def _autosave_all_tabs(self):
+        # Main thread only grabs the buffer of tabs that actually changed;
+        # the disk writes happen on the single-worker executor.
+        wrote_any = False
         for td in list(self.tabs.values()):
+            if not td.dirty:
+                continue
             try:
                 content = td.text.get("1.0", "end-1c")
                 fname = AUTOSAVE_PREFIX + td.autosave_id + ".txt"
                 fpath = os.path.join(self.autosave_dir, fname)
-                with open(fpath, "w", encoding="utf-8") as f:
-                    f.write(content)
-                meta = {
+                self._autosave_index[td.autosave_id] = {
                     "file_path": td.file_path,
                     "timestamp": time.time(),
                     "title": os.path.basename(td.file_path) if td.file_path else self.notebook.tab(td.frame, option="text"),
                     "encoding": td.encoding,
                 }
-                meta_path = fpath + AUTOSAVE_META_EXT
-                with open(meta_path, "w", encoding="utf-8") as m:
-                    json.dump(meta, m)
+                # cleared at hand-off: edits during the write re-set it
+                td.dirty = False
+                self._autosave_executor.submit(self._write_atomic, fpath, content)
+                wrote_any = True
             except Exception:
                 pass
+        if wrote_any:
+            # one combined index instead of a .meta sidecar per tab
+            self._autosave_executor.submit(
+                self._write_atomic, self._autosave_index_path(), _dumps_index(self._autosave_index))
         self._schedule_autosave()
 
+    def _autosave_index_path(self):
+        return os.path.join(self.autosave_dir, AUTOSAVE_INDEX_NAME)
+
+    @staticmethod
+    def _write_atomic(fpath, data):
+        # Worker thread: temp file + os.replace keeps each autosave atomic,
+        # so a crash mid-write never truncates the previous good copy.
+        try:
+            tmp = fpath + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, fpath)
+        except Exception:
+            pass
+
     def _schedule_autosave(self):
         self.root.after(AUTOSAVE_INTERVAL_MS, self._autosave_all_tabs)
 
     def _list_autosave_files(self):
-        files = []
-        for name in os.listdir(self.autosave_dir):
-            if name.startswith(AUTOSAVE_PREFIX) and name.endswith(".txt"):
-                files.append(os.path.join(self.autosave_dir, name))
-        return files
-
-    def _recover_autosaves_on_startup(self):
-        autosave_files = self._list_autosave_files()
-        if not autosave_files:
-            return
-        to_recover = []
-        for fpath in autosave_files:
-            meta_path = fpath + AUTOSAVE_META_EXT
-            try:
-                with open(meta_path, "r", encoding="utf-8") as m:
-                    meta = json.load(m)
-            except Exception:
-                meta = {"file_path": None, "title": "Recovered", "encoding": "utf-8"}
-            to_recover.append((fpath, meta))
-        if not to_recover:
-            return
-        if not messagebox.askyesno("Recover files", f"Found {len(to_recover)} autosave file(s). Recover them?"):
-            return
-        for fpath, meta in to_recover:
+        # scandir hands back entries with their path already joined
+        with os.scandir(self.autosave_dir) as it:
+            return [e.path for e in it
+                    if e.name.startswith(AUTOSAVE_PREFIX) and e.name.endswith(".txt") and e.is_file()]
+
+    def _kick_recovery(self):
+        self._recovery_queue = queue.Queue()
+        threading.Thread(target=self._scan_autosaves_bg, daemon=True).start()
+        self.root.after(50, self._poll_recovery)
+
+    def _scan_autosaves_bg(self):
+        # Worker thread: filesystem + json only, no Tk calls here.
+        try:
+            with open(self._autosave_index_path(), "r", encoding="utf-8") as idx:
+                index = json.load(idx)
+        except Exception:
+            index = {}
+        found = []
+        for fpath in self._list_autosave_files():
+            autosave_id = os.path.basename(fpath)[len(AUTOSAVE_PREFIX):-4]
+            meta = index.get(autosave_id)
+            if meta is None:
+                # migration: files written before the combined index used a
+                # .meta sidecar each
+                meta_path = fpath + AUTOSAVE_META_EXT
+                try:
+                    with open(meta_path, "r", encoding="utf-8") as m:
+                        meta = json.load(m)
+                except Exception:
+                    meta = {"file_path": None, "title": "Recovered", "encoding": "utf-8"}
             try:
                 with open(fpath, "r", encoding="utf-8") as f:
                     content = f.read()
             except Exception:
                 content = ""
+            found.append((fpath, meta, content))
+        self._recovery_queue.put(found)
+
+    def _poll_recovery(self):
+        try:
+            found = self._recovery_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_recovery)
+            return
+        if not found:
+            return
+        if not messagebox.askyesno("Recover files", f"Found {len(found)} autosave file(s). Recover them?"):
+            return
+        for fpath, meta, content in found:
             title = meta.get("title") or "Recovered"
             file_path = meta.get("file_path")
             autosave_id = os.path.basename(fpath)[len(AUTOSAVE_PREFIX):-4]
@@ -612,6 +878,10 @@ class AdvancedEditor:
                     os.remove(mp)
             except Exception:
                 pass
+        try:
+            os.remove(self._autosave_index_path())
+        except OSError:
+            pass
 
     def _remove_autosave_file(self, td):
         fname = AUTOSAVE_PREFIX + td.autosave_id + ".txt"
@@ -623,6 +893,9 @@ class AdvancedEditor:
                     os.remove(p)
             except Exception:
                 pass
+        if self._autosave_index.pop(td.autosave_id, None) is not None:
+            self._autosave_executor.submit(
+                self._write_atomic, self._autosave_index_path(), _dumps_index(self._autosave_index))
 
     # ---------- Combined Inline Formatting (Bold/Italic/Underline) ----------
     # We use a single tag per combination and cache fonts by (bold, italic, underline)
@@ -633,29 +906,27 @@ class AdvancedEditor:
         if not td:
             return tagname
         txt = td.text
-        if tagname not in txt.tag_names():
-            # Create a font derived from the current family/size
-            f = font.Font(family=self.current_font_family.get(), size=self.base_font_size.get(),
-                          weight=("bold" if bold else "normal"),
-                          slant=("italic" if italic else "roman"),
-                          underline=1 if underline else 0)
-            txt.tag_configure(tagname, font=f)
-            self.style_tag_cache[key] = tagname
+        # shared named font, and tag_configure is idempotent: one cheap
+        # Tcl call, no per-tab font.Font registration or tag_names query
+        txt.tag_configure(tagname, font=f"app_style_{tagname[-3:]}")
+        self.style_tag_cache[key] = tagname
+        self._style_tag_names.add(tagname)
         return tagname
 
     def _clear_style_tags_in_range(self, text: tk.Text, start: str, end: str):
-        for t in list(text.tag_names()):
-            if t.startswith("style_"):
-                text.tag_remove(t, start, end)
+        # at most 8 combination tags ever exist; never walk the widget's
+        # full tag list (which also holds every color_* tag)
+        for t in self._style_tag_names:
+            text.tag_remove(t, start, end)
 
     def _get_combined_style_at_index(self, text: tk.Text, idx: str):
         """Returns (bold, italic, underline) based on the topmost style_* tag at idx, else defaults."""
         tags = text.tag_names(idx)
         # find any style_ tags; if multiple, the last one in tag order "wins"
         for t in reversed(tags):
-            if t.startswith("style_") and len(t) == len("style_") + 3:
-                b, i, u = t[-3], t[-2], t[-1]
-                return (b == "1", i == "1", u == "1")
+            bits = _STYLE_BITS.get(t)
+            if bits is not None:
+                return bits
         # fallback: no style tag present
         return (False, False, False)
 
@@ -727,20 +998,32 @@ class AdvancedEditor:
         self._snapshot_state()
 
     # ---------- Color ----------
+    @staticmethod
+    def _ensure_color_tag(td, tagname, color):
+        lru = td.color_tags
+        if tagname in lru:
+            lru.move_to_end(tagname)
+            return
+        td.text.tag_configure(tagname, foreground=color)
+        lru[tagname] = None
+        if len(lru) > MAX_COLOR_TAGS:
+            oldest, _ = lru.popitem(last=False)
+            # evicted ranges fall back to the default foreground
+            td.text.tag_delete(oldest)
+
     def _set_text_color(self):
+        from tkinter import colorchooser
         color = colorchooser.askcolor()[1]
         td = self._get_current_tabdata()
         if color and td:
+            color = color.lower()
             tagname = f"color_{color}"
-            if tagname not in td.text.tag_names():
-                td.text.tag_configure(tagname, foreground=color)
+            self._ensure_color_tag(td, tagname, color)
             if td.text.tag_ranges("sel"):
                 td.text.tag_add(tagname, "sel.first", "sel.last")
                 self._snapshot_state()
             else:
-                # Apply to typing by making a composite style+color tag layered:
                 # We keep color as a separate tag to allow combining with B/I/U style tags.
-                td.text.tag_add(tagname, tk.INSERT, tk.INSERT)  # no-op; just ensure exists
                 self.status.set(f"Typing color: {color}")
                 self.root.after(1200, self._update_status)
 
@@ -757,29 +1040,28 @@ class AdvancedEditor:
             return
         text = td.text
 
-        def apply_to_line(idx, i):
-            line_start = text.index(f"{idx} linestart")
-            current = text.get(line_start, f"{idx} lineend")
+        def renumber(line, i):
             # Avoid extra indentation: strip existing bullets and spaces first
-            new = re.sub(r"^(\s*(?:[\-\*•]|\d+\.)\s+)?", "", current)
-            if numbered:
-                new = f"{i}. {new}"
-            else:
-                new = f"{prefix}{new}"
-            text.delete(line_start, f"{idx} lineend")
-            text.insert(line_start, new)
+            body = _BULLET_RE.sub("", line, count=1)
+            return f"{i}. {body}" if numbered else f"{prefix}{body}"
 
         if text.tag_ranges("sel"):
+            # one get + one delete/insert for the whole block instead of
+            # five Tk round-trips (and a regex compile) per line
             first = int(text.index("sel.first").split(".")[0])
             last = int(text.index("sel.last").split(".")[0])
-            n = 1
-            for ln in range(first, last + 1):
-                apply_to_line(f"{ln}.0", n)
-                n += 1
+            first_idx, last_idx = f"{first}.0", f"{last}.end"
+            block = text.get(first_idx, last_idx)
+            new_block = "\n".join(renumber(line, i)
+                                  for i, line in enumerate(block.split("\n"), start=1))
+            text.delete(first_idx, last_idx)
+            text.insert(first_idx, new_block)
         else:
-            curr = text.index("insert")
-            ln = curr.split(".")[0]
-            apply_to_line(f"{ln}.0", 1)
+            ln = text.index("insert").split(".")[0]
+            line_start, line_end = f"{ln}.0", f"{ln}.end"
+            new_line = renumber(text.get(line_start, line_end), 1)
+            text.delete(line_start, line_end)
+            text.insert(line_start, new_line)
         self._snapshot_state()
 
     # ---------- Links ----------
@@ -787,6 +1069,7 @@ class AdvancedEditor:
         td = self._get_current_tabdata()
         if not td:
             return
+        from tkinter import simpledialog
         url = simpledialog.askstring("Insert Link", "Enter URL:")
         if not url:
             return
@@ -803,15 +1086,15 @@ class AdvancedEditor:
             disp = display or url
             text.insert(a, disp)
             b = text.index(f"{a}+{len(disp)}c")
-        tagname = self._make_link_tag(url)
-        text.tag_add(tagname, a, b)
         text.tag_add("link", a, b)
+        self._register_link(td, a, b, url)
         self._snapshot_state()
 
     def _insert_email_link(self):
         td = self._get_current_tabdata()
         if not td:
             return
+        from tkinter import simpledialog
         email = simpledialog.askstring("Email", "Enter email address:")
         if not email:
             return
@@ -827,35 +1110,42 @@ class AdvancedEditor:
             text.delete(a, b)
         text.insert(a, disp)
         b = text.index(f"{a}+{len(disp)}c")
-        tagname = self._make_link_tag(mailto)
-        text.tag_add(tagname, a, b)
         text.tag_add("link", a, b)
+        self._register_link(td, a, b, mailto)
         self._snapshot_state()
 
-    def _make_link_tag(self, url):
-        td = self._get_current_tabdata()
+    @staticmethod
+    def _char_offset(text, idx):
+        counted = text.count("1.0", idx, "chars")
+        return counted[0] if counted else 0
+
+    def _register_link(self, td, a, b, url):
+        # One shared "link" tag does the styling; the target URL lives in
+        # the tab's link list. The endpoints are Tk marks, not frozen
+        # offsets: edits earlier in the document shift marks exactly like
+        # the visual tag, so clicks never resolve against stale spans.
         text = td.text
-        tagname = f"link_{abs(hash(url))}"
-        if tagname not in text.tag_names():
-            text.tag_configure(tagname)  # create
-            if not hasattr(text, "_link_targets"):
-                text._link_targets = {}
-            text._link_targets[tagname] = url
-        return tagname
+        n = next(_LINK_IDS)
+        sm, em = f"linkstart{n}", f"linkend{n}"
+        text.mark_set(sm, a)
+        text.mark_set(em, b)
+        # inserts at the start push the link right; inserts at the end
+        # stay outside it — the same boundary behaviour as the tag
+        text.mark_gravity(sm, "right")
+        text.mark_gravity(em, "left")
+        td.link_ranges.append((sm, em, url))
 
     def _open_link_at_event(self, event):
         td = self._get_current_tabdata()
-        if not td:
+        if not td or not td.link_ranges:
             return
         text = td.text
         idx = text.index(f"@{event.x},{event.y}")
-        tags = text.tag_names(idx)
-        for t in tags:
-            if t.startswith("link_") and hasattr(text, "_link_targets"):
-                url = text._link_targets.get(t)
-                if url:
-                    webbrowser.open(url)
-                    return
+        for sm, em, url in td.link_ranges:
+            if url and text.compare(sm, "<=", idx) and text.compare(idx, "<", em):
+                import webbrowser
+                webbrowser.open(url)
+                return
 
     # ---------- View helpers ----------
     def _toggle_wrap(self):
@@ -872,27 +1162,47 @@ class AdvancedEditor:
         self._refresh_fonts()
         self._snapshot_state()
 
+    def _init_named_fonts(self):
+        family = self.current_font_family.get()
+        size = self.base_font_size.get()
+        self._named_font("app_base", family=family, size=size)
+        for name, sz in HEADING_SIZES.items():
+            if name == "Normal":
+                continue
+            self._named_font(f"app_{name.lower()}", family=family, size=sz, weight="bold")
+        # the 8 bold/italic/underline combinations, shared by every tab
+        for bits in ("000", "001", "010", "011", "100", "101", "110", "111"):
+            self._named_font(f"app_style_{bits}", family=family, size=size,
+                             weight="bold" if bits[0] == "1" else "normal",
+                             slant="italic" if bits[1] == "1" else "roman",
+                             underline=int(bits[2]))
+        self._last_font_spec = (family, size)
+
+    @staticmethod
+    def _named_font(name, **options):
+        try:
+            font.Font(name=name, **options)
+        except tk.TclError:
+            # already registered by an earlier editor instance: retune it
+            font.nametofont(name).configure(**options)
+
     def _refresh_fonts(self):
-        # Update base font and all style/heading tag fonts to current family/size
-        for td in self.tabs.values():
-            base = font.Font(family=self.current_font_family.get(), size=self.base_font_size.get())
-            td.text.configure(font=base)
-            # Update heading tags
-            for name, sz in HEADING_SIZES.items():
-                if name == "Normal":
-                    continue
-                td.text.tag_configure(name.lower(), font=font.Font(family=self.current_font_family.get(), size=sz, weight="bold"))
-            # Update cached style_* tags to new base family/size while keeping attributes
-            for t in td.text.tag_names():
-                if t.startswith("style_") and len(t) == len("style_") + 3:
-                    b = t[-3] == "1"
-                    i = t[-2] == "1"
-                    u = t[-1] == "1"
-                    f = font.Font(family=self.current_font_family.get(), size=self.base_font_size.get(),
-                                  weight=("bold" if b else "normal"),
-                                  slant=("italic" if i else "roman"),
-                                  underline=1 if u else 0)
-                    td.text.tag_configure(t, font=f)
+        # Named fonts: every tab and every tag updates through one
+        # configure per font, no per-tab rebuilding at all
+        family = self.current_font_family.get()
+        size = self.base_font_size.get()
+        # key-repeat on the zoom shortcuts hits this hard; skip when the
+        # spec hasn't actually changed
+        if (family, size) == self._last_font_spec:
+            return
+        self._last_font_spec = (family, size)
+        font.nametofont("app_base").configure(family=family, size=size)
+        for name in HEADING_SIZES:
+            if name == "Normal":
+                continue
+            font.nametofont(f"app_{name.lower()}").configure(family=family)
+        for bits in ("000", "001", "010", "011", "100", "101", "110", "111"):
+            font.nametofont(f"app_style_{bits}").configure(family=family, size=size)
 
     def _apply_encoding_to_tab(self, enc):
         td = self._get_current_tabdata()
@@ -906,26 +1216,66 @@ class AdvancedEditor:
             return
         text = td.text
 
+        from tkinter import simpledialog
         find_str = simpledialog.askstring("Find", "Find:")
         if not find_str:
             return
         replace_str = simpledialog.askstring("Replace", "Replace with (leave blank to skip):")
         if replace_str is not None:
-            content = text.get("1.0", "end-1c")
-            new_content = content.replace(find_str, replace_str)
-            text.delete("1.0", "end")
-            text.insert("1.0", new_content)
+            # replace each hit in place: only the matched ranges are
+            # touched, so tags elsewhere in the document survive and no
+            # full-buffer copy is made. Hits are collected first and
+            # applied in reverse so earlier indices stay valid.
+            hits = []
+            start = "1.0"
+            flen = len(find_str)
+            while True:
+                start = text.search(find_str, start, stopindex="end")
+                if not start:
+                    break
+                end = text.index(f"{start}+{flen}c")
+                hits.append((start, end))
+                start = end
+            for a, b in reversed(hits):
+                text.delete(a, b)
+                text.insert(a, replace_str)
+            td.search_hits = []
+            td.search_lines = []
             self._snapshot_state()
         else:
-            text.tag_remove("highlight", "1.0", "end")
+            # collect every match once, but only tag the visible slice;
+            # scrolling re-tags lazily (tagging thousands of matches at
+            # once is what makes search crawl on big documents)
+            hits = []
             start = "1.0"
             while True:
                 start = text.search(find_str, start, stopindex="end")
                 if not start:
                     break
-                end = f"{start}+{len(find_str)}c"
-                text.tag_add("highlight", start, end)
+                end = text.index(f"{start}+{len(find_str)}c")
+                hits.append((int(start.split(".", 1)[0]), start, end))
                 start = end
+            td.search_hits = hits
+            td.search_lines = [h[0] for h in hits]
+            self._highlight_visible_hits(td)
+
+    def _highlight_visible_hits(self, td):
+        text = td.text
+        text.tag_remove("highlight", "1.0", "end")
+        if not td.search_hits:
+            return
+        top = int(text.index("@0,0").split(".", 1)[0])
+        bottom = int(text.index(f"@0,{text.winfo_height()}").split(".", 1)[0])
+        lo = bisect.bisect_left(td.search_lines, top)
+        hi = bisect.bisect_right(td.search_lines, bottom)
+        for _, a, b in td.search_hits[lo:hi]:
+            text.tag_add("highlight", a, b)
+
+    def _on_text_scrolled(self, text, first, last):
+        # yscrollcommand hook: retag search hits for the new viewport
+        td = self.tabs.get(text.master)
+        if td is not None and td.search_hits:
+            self._highlight_visible_hits(td)
 
     # ---------- Shortcuts & exit ----------
     def _bind_shortcuts(self):
@@ -958,12 +1308,16 @@ class AdvancedEditor:
 
     def _inc_font_size(self, event=None):
         new_size = min(64, self.base_font_size.get() + 1)
+        if new_size == self.base_font_size.get():
+            return  # already at the clamp
         self.base_font_size.set(new_size)
         self.size_combo.set(new_size)
         self._refresh_fonts()
 
     def _dec_font_size(self, event=None):
         new_size = max(8, self.base_font_size.get() - 1)
+        if new_size == self.base_font_size.get():
+            return
         self.base_font_size.set(new_size)
         self.size_combo.set(new_size)
         self._refresh_fonts()
@@ -1006,10 +1360,25 @@ class AdvancedEditor:
                     a, b = str(ranges[i]), str(ranges[i+1])
                     pairs.append((a, b))
                 tags_state[tname] = pairs
+        # resolve the link marks to plain offsets for the snapshot (marks
+        # collapse when the buffer is rewritten, so states store numbers)
+        # and drop links whose text has been deleted out from under them
+        live_links = []
+        links_state = []
+        for sm, em, url in td.link_ranges:
+            s = self._char_offset(txt, sm)
+            e = self._char_offset(txt, em)
+            if s < e:
+                live_links.append((sm, em, url))
+                links_state.append((s, e, url))
+            else:
+                txt.mark_unset(sm, em)
+        td.link_ranges = live_links
         insert_idx = txt.index(tk.INSERT)
         return {
             "content": content,
             "tags": tags_state,
+            "links": links_state,
             "insert": insert_idx,
             "encoding": td.encoding,
             "font_family": self.current_font_family.get(),
@@ -1025,10 +1394,8 @@ class AdvancedEditor:
         txt = td.text
         txt.delete("1.0", "end")
         txt.insert("1.0", state.get("content", ""))
-
-        # clear all tags
-        for t in txt.tag_names():
-            txt.tag_remove(t, "1.0", "end")
+        # no tag_remove sweep needed: the delete+insert above already
+        # emptied every tag's ranges
 
         # reapply known tag configs (fonts)
         self.current_font_family.set(state.get("font_family", self.current_font_family.get()))
@@ -1036,56 +1403,129 @@ class AdvancedEditor:
         self.size_combo.set(self.base_font_size.get())
         self._refresh_fonts()
 
-        # recreate color and style tags as needed
+        # recreate color and style tags as needed (tag_names() snapshotted
+        # once: O(tags) instead of O(tags^2) membership scans)
+        existing = set(txt.tag_names())
         for tname, pairs in state.get("tags", {}).items():
-            if tname not in txt.tag_names():
+            if tname not in existing:
                 if tname.startswith("color_"):
                     color = tname.split("_", 1)[1]
-                    txt.tag_configure(tname, foreground=color)
-                elif tname.startswith("style_") and len(tname) == len("style_") + 3:
-                    b, i, u = tname[-3] == "1", tname[-2] == "1", tname[-1] == "1"
-                    self._ensure_style_tag(b, i, u)
+                    self._ensure_color_tag(td, tname, color)
+                elif tname in _STYLE_BITS:
+                    self._ensure_style_tag(*_STYLE_BITS[tname])
                 elif tname.startswith("link_"):
                     txt.tag_configure(tname)
-            for a, b in pairs:
-                txt.tag_add(tname, a, b)
+            if pairs:
+                # Tk accepts multiple ranges in one tag_add call
+                txt.tag_add(tname, *(idx for pair in pairs for idx in pair))
 
-        # generic link style re-ensured
+        # generic link style re-ensured, and the link anchors rebuilt from
+        # the same capture — otherwise clicks resolve against stale spans
         txt.tag_configure("link", foreground="#7aa2ff", underline=1)
+        for sm, em, _url in td.link_ranges:
+            txt.mark_unset(sm, em)
+        td.link_ranges = []
+        for s, e, url in state.get("links") or ():
+            self._register_link(td, f"1.0+{s}c", f"1.0+{e}c", url)
         txt.mark_set(tk.INSERT, state.get("insert", "1.0"))
         td.encoding = state.get("encoding", td.encoding)
         self.encoding_var.set(td.encoding)
         self._update_status()
 
+    @staticmethod
+    def _make_delta(base, target):
+        """Delta that rebuilds `target` from `base` (content by spans, the small metadata verbatim).
+
+        Plain typing doesn't touch tags, so in that case the delta stores
+        None instead of pinning the whole old tag map in the history deque.
+        """
+        return {
+            "ops": _content_delta(base["content"], target["content"]),
+            "tags": None if target["tags"] == base["tags"] else target["tags"],
+            "links": None if target["links"] == base["links"] else target["links"],
+            "insert": target["insert"],
+            "encoding": target["encoding"],
+            "font_family": target["font_family"],
+            "font_size": target["font_size"],
+        }
+
+    @staticmethod
+    def _commit_snapshot(td, state):
+        """Adopt `state` as the tab's latest snapshot and refresh its counters."""
+        td.last_snapshot_state = state
+        content = state["content"]
+        td.char_count = len(content)
+        # finditer: count matches without materialising a list of every word
+        td.word_count = sum(1 for _ in _WORD_RE.finditer(content))
+
+    @staticmethod
+    def _resolve_delta(base, delta):
+        state = dict(delta)
+        state["content"] = _apply_delta(base["content"], state.pop("ops"))
+        if state["tags"] is None:
+            state["tags"] = base["tags"]
+        if state["links"] is None:
+            state["links"] = base["links"]
+        return state
+
     def _snapshot_state(self, force=False):
+        # Coalesce: a formatting action that fires several snapshot
+        # requests in one event-loop turn captures the document once,
+        # at idle. Forced snapshots (new tab, undo bookkeeping) run now.
+        self._snap_after_id = None
+        if not force:
+            if self._snapshot_pending:
+                return
+            self._snapshot_pending = True
+            self.root.after_idle(self._do_snapshot)
+            return
+        self._do_snapshot(force=True)
+
+    def _do_snapshot(self, force=False):
+        self._snapshot_pending = False
         td = self._get_current_tabdata()
         if not td:
             return
         state = self._capture_state()
-        serial = (hash(state["content"]) ^ hash(tuple(sorted((k, tuple(v)) for k, v in state["tags"].items())))) & 0xFFFFFFFF
-        if force or serial != td.last_snapshot_serial:
-            td.history.append(state)
-            if len(td.history) > 200:
-                td.history = td.history[-200:]
-            td.future.clear()
-            td.last_snapshot_serial = serial
+        prev = td.last_snapshot_state
+        # direct comparison beats the old content+tags hash serial: a
+        # changed length rejects in O(1), and the equal case is a memcmp
+        # instead of a full hashing pass
+        if force or prev is None or prev["content"] != state["content"] or prev["tags"] != state["tags"]:
+            if prev is not None:
+                td.history.append(self._make_delta(state, prev))
+                td.future.clear()
+            self._commit_snapshot(td, state)
 
     def _undo(self, event=None):
         td = self._get_current_tabdata()
         if not td or not td.history:
             return
-        if len(td.history) >= 1:
-            state = td.history.pop()
-            td.future.append(self._capture_state())
-            self._restore_state(state)
+        # Keystrokes inside the debounce window aren't in the history
+        # yet; push them first so the popped delta resolves against the
+        # same base it was diffed from.
+        self._do_snapshot()
+        if not td.history:
+            return
+        current = td.last_snapshot_state
+        previous = self._resolve_delta(current, td.history.pop())
+        td.future.append(self._make_delta(previous, current))
+        self._restore_state(previous)
+        self._commit_snapshot(td, previous)
 
     def _redo(self, event=None):
         td = self._get_current_tabdata()
         if not td or not td.future:
             return
-        state = td.future.pop()
-        td.history.append(self._capture_state())
-        self._restore_state(state)
+        self._do_snapshot()
+        if not td.future:
+            # the flush found new edits, which invalidate the redo stack
+            return
+        current = td.last_snapshot_state
+        nxt = self._resolve_delta(current, td.future.pop())
+        td.history.append(self._make_delta(nxt, current))
+        self._restore_state(nxt)
+        self._commit_snapshot(td, nxt)
 
     def _cut(self):
         td = self._get_current_tabdata()
@@ -1116,7 +1556,11 @@ class AdvancedEditor:
             td.text.delete("1.0", "end")
             self._snapshot_state()
 
-if __name__ == "__main__":
+def main():
     Root = ctk.CTk() if ctk is not None else tk.Tk()
     app = AdvancedEditor(Root)
-    Root.mainloop()
\ No newline at end of file
+    Root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -3,7 +3,10 @@ import tkinter as tk
 from tkinter import messagebox, filedialog
 from tkinter.ttk import Progressbar, Style, Button, Label, Entry
 import threading
-from slide_extractor import SlideExtractor  # Import your SlideExtractor class from slide_extractor.py
+try:
+    from .slide_extractor import SlideExtractor  # Import your SlideExtractor class from slide_extractor.py
+except ImportError:  # run directly as a script, not as part of the package
+    from slide_extractor import SlideExtractor
 from PIL import Image
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
@@ -145,8 +148,12 @@ class SlideExtractorApp:
             messagebox.showerror("Error", f"Error generating PDF: {str(e)}")
 
 
-# Run the application
-if __name__ == "__main__":
+def main():
     root = tk.Tk()
     app = SlideExtractorApp(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+
+# Run the application
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -2,6 +2,11 @@
 LaTeX support for pretty printing equations.
 """
 
+# Fixed fragments of the \frac template, interned once at import.
+_FRAC_OPEN = "\\frac{"
+_FRAC_MID = "}{"
+_FRAC_CLOSE = "}"
+
 def latex_fraction(numerator, denominator):
     """
     Generate LaTeX code for a fraction.
@@ -17,7 +22,7 @@ def latex_fraction(numerator, denominator):
         >>> latex_fraction(1, 2)
         '\\frac{1}{2}'
     """
-    return f"\\frac{{{numerator}}}{{{denominator}}}"
+    return _FRAC_OPEN + str(numerator) + _FRAC_MID + str(denominator) + _FRAC_CLOSE
 
 def latex_equation(expression, variable="x"):
     """
@@ -52,6 +57,18 @@ def latex_matrix(matrix):
         >>> latex_matrix([[1, 2], [3, 4]])
         '\\begin{bmatrix} 1 & 2 \\\\ 3 & 4 \\end{bmatrix}'
     """
-    rows = [" & ".join(map(str, row)) for row in matrix]
-    matrix_body = " \\\\ ".join(rows)
-    return f"\\begin{{bmatrix}} {matrix_body} \\end{{bmatrix}}"
\ No newline at end of file
+    # Build the whole body with a single join over a flat parts list;
+    # the per-row joins plus the outer join allocate an intermediate
+    # string for every row.
+    parts = ["\\begin{bmatrix}"]
+    sep = ""
+    for row in matrix:
+        parts.append(sep)
+        sep = " \\\\"
+        cell_sep = " "
+        for cell in row:
+            parts.append(cell_sep)
+            parts.append(str(cell))
+            cell_sep = " & "
+    parts.append(" \\end{bmatrix}")
+    return "".join(parts)
\ No newline at end of file
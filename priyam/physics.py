@@ -23,24 +23,45 @@ class Kinematics:
         """v^2 = u^2 + 2 a s"""
         return float(u * u + 2 * a * s)
 
+    @staticmethod
+    def final_velocity_batch(u, a, t):
+        """
+        v = u + a t over numpy arrays (or scalars, via broadcasting).
+
+        The scalar method costs a Python call per projectile; this runs
+        the whole batch in one C loop.
+        """
+        import numpy as np
+
+        return np.asarray(u) + np.asarray(a) * np.asarray(t)
+
+    @staticmethod
+    def displacement_batch(u, t, a=0):
+        """s = u t + 0.5 a t^2 over numpy arrays (or scalars)."""
+        import numpy as np
+
+        t = np.asarray(t)
+        return np.asarray(u) * t + 0.5 * np.asarray(a) * t * t
+
     @staticmethod
     def time_from_displacement(u: Number, a: Number, s: Number) -> Tuple[float, float]:
         """
         Solve s = u t + 1/2 a t^2 for t.
-        Returns both roots (could be complex if discriminant < 0).
+        Returns both real roots, or (nan, nan) when the displacement is
+        never reached. Falls back to the linear solution for a ~ 0.
         """
-        A = 0.5 * a
-        B = u
-        C = -s
-        disc = B * B - 4 * A * C
+        if abs(a) < 1e-12:
+            t = s / u  # s = u t
+            return float(t), float(t)
+        disc = u * u + 2 * a * s
         if disc < 0:
-            # complex roots
-            sqrt_disc = complex(0, math.sqrt(-disc))
-        else:
-            sqrt_disc = math.sqrt(disc)
-        t1 = (-B + sqrt_disc) / (2 * A)
-        t2 = (-B - sqrt_disc) / (2 * A)
-        return float(t1), float(t2)
+            return float("nan"), float("nan")
+        # stable form: q avoids subtracting nearly equal quantities when
+        # one root is much smaller than the other
+        q = -0.5 * (u + math.copysign(math.sqrt(disc), u))
+        if q == 0:
+            return 0.0, 0.0
+        return float(2 * q / a), float(-s / q)
 
 
 class Dynamics:
@@ -73,6 +94,14 @@ class Dynamics:
         """U = m g h"""
         return float(mass * g * height)
 
+    @staticmethod
+    def kinetic_energy_batch(mass, velocity):
+        """K = 1/2 m v^2 over numpy arrays (or scalars)."""
+        import numpy as np
+
+        v = np.asarray(velocity)
+        return 0.5 * np.asarray(mass) * v * v
+
 
 class ProjectileMotion:
     """
@@ -88,12 +117,37 @@ class ProjectileMotion:
     @staticmethod
     def range(u: Number, theta: Number, g: Number = 9.81) -> float:
         """R = u^2 sin(2 theta) / g"""
-        return float((u ** 2) * math.sin(2 * theta) / g)
+        return float(u * u * math.sin(2 * theta) / g)
 
     @staticmethod
     def max_height(u: Number, theta: Number, g: Number = 9.81) -> float:
         """H = u^2 sin^2(theta) / (2 g)"""
-        return float((u ** 2) * (math.sin(theta) ** 2) / (2 * g))
+        s = math.sin(theta)
+        return float(u * u * s * s / (2 * g))
+
+    @staticmethod
+    def time_of_flight_batch(u, theta, g=9.81):
+        """T = 2 u sin(theta) / g over numpy arrays (or scalars)."""
+        import numpy as np
+
+        return 2 * np.asarray(u) * np.sin(theta) / g
+
+    @staticmethod
+    def range_batch(u, theta, g=9.81):
+        """R = u^2 sin(2 theta) / g over numpy arrays (or scalars)."""
+        import numpy as np
+
+        u = np.asarray(u)
+        return u * u * np.sin(2 * np.asarray(theta)) / g
+
+    @staticmethod
+    def max_height_batch(u, theta, g=9.81):
+        """H = u^2 sin^2(theta) / (2 g) over numpy arrays (or scalars)."""
+        import numpy as np
+
+        u = np.asarray(u)
+        s = np.sin(theta)
+        return u * u * s * s / (2 * g)
 
 
 class WavesOptics:
@@ -126,6 +180,7 @@ class Electromagnetism:
 
     K_E = 8.9875517923e9  # Coulomb constant (N m^2 / C^2)
     MU_0 = 4 * math.pi * 1e-7  # vacuum permeability (N/A^2)
+    _MU0_OVER_2PI = 2e-7  # MU_0 / (2 pi), exactly, folded at definition time
 
     @staticmethod
     def coulomb_force(q1: Number, q2: Number, r: Number) -> float:
@@ -135,7 +190,7 @@ class Electromagnetism:
         """
         if r == 0:
             raise ValueError("Distance r must be nonzero.")
-        return float(Electromagnetism.K_E * abs(q1 * q2) / (r ** 2))
+        return float(Electromagnetism.K_E * abs(q1 * q2) / (r * r))
 
     @staticmethod
     def electric_field_point_charge(q: Number, r: Number) -> float:
@@ -145,7 +200,7 @@ class Electromagnetism:
         """
         if r == 0:
             raise ValueError("Distance r must be nonzero.")
-        return float(Electromagnetism.K_E * abs(q) / (r ** 2))
+        return float(Electromagnetism.K_E * abs(q) / (r * r))
 
     @staticmethod
     def magnetic_field_long_wire(I: Number, r: Number) -> float:
@@ -155,7 +210,7 @@ class Electromagnetism:
         """
         if r == 0:
             raise ValueError("Distance r must be nonzero.")
-        return float(Electromagnetism.MU_0 * I / (2 * math.pi * r))
+        return float(Electromagnetism._MU0_OVER_2PI * I / r)
 
     @staticmethod
     def lorentz_force(q: Number, v: Number, B: Number, theta: Number) -> float:
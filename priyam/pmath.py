@@ -1,13 +1,14 @@
 from typing import Union, List, Callable, Optional
 from sympy import Function, dsolve, Derivative
-from sympy import ( symbols, Eq, sympify, solve, diff, integrate, limit, series, Matrix, det, simplify, lambdify, factorint, isprime, primerange, gcd, lcm, mod_inverse)
+from sympy import ( symbols, Eq, sympify, solve, diff, integrate, limit, series, Matrix, det, simplify, cancel, factor, expand, lambdify, factorint, isprime, primerange, gcd, lcm, mod_inverse, Rational)
 import math
 import random
 from collections import Counter
+from fractions import Fraction
 from datetime import datetime, timedelta
 import pytz
 import sympy
-from functools import reduce
+from functools import reduce, lru_cache
 from dateutil import rrule
 from dateutil.relativedelta import relativedelta
 import cmath
@@ -17,6 +18,141 @@ from collections import defaultdict
 
 Number = Union[int, float]
 
+
+def _welford(data):
+    """
+    One-pass sum of squared deviations via Welford's online update.
+    Numerically stable (no catastrophic cancellation on poorly scaled
+    data) and reads the input once. Returns (M2, n).
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in data:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return m2, n
+
+
+# Fibonacci numbers computed so far; extended lazily, never rebuilt.
+_FIB = [0, 1]
+
+# Miller-Rabin witnesses proven deterministic for every n < 3.3e24.
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Gaps between integers coprime to 30, cycling from d = 7 upward.
+_WHEEL = (4, 2, 4, 2, 4, 6, 2, 6)
+
+# Past this trial divisor, switch to Pollard rho for the residual.
+_TRIAL_LIMIT = 1_000_000
+
+
+def _pollard_rho(n):
+    """
+    Find a nontrivial factor of an odd composite n using Brent's
+    variant of Pollard's rho: differences are accumulated as a running
+    product modulo n so one gcd covers ~128 iteration steps.
+    """
+    while True:
+        y = random.randrange(1, n)
+        c = random.randrange(1, n)
+        m = 128
+        g = r = q = 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # The batch overshot: replay it one gcd at a time.
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def _split_residual(n, factors):
+    """Recursively split n (odd, > 1) into prime factors via rho."""
+    if MathSolver.is_prime(n):
+        factors[n] = factors.get(n, 0) + 1
+        return
+    d = _pollard_rho(n)
+    _split_residual(d, factors)
+    _split_residual(n // d, factors)
+
+
+@lru_cache(maxsize=1024)
+def _sym(name):
+    """Cached Symbol per name; keeps Symbol identity stable across calls."""
+    return symbols(name)
+
+
+@lru_cache(maxsize=1024)
+def _sympify_str(s):
+    """Cached sympify for strings — the parse is repeated work in loops."""
+    return sympify(s)
+
+
+@lru_cache(maxsize=None)
+def _tz(name):
+    """Cached pytz timezone construction per zone name."""
+    return pytz.timezone(name)
+
+
+def _as_expr(expr):
+    """Sympify strings through the cache; pass sympy objects straight through."""
+    return _sympify_str(expr) if isinstance(expr, str) else expr
+
+
+@lru_cache(maxsize=4096)
+def _binom_coeff(n, k):
+    """Cached binomial coefficient — sweeps over p reuse the same (n, k)."""
+    return math.comb(n, k)
+
+
+@lru_cache(maxsize=256)
+def _simplify_cached(expr_str):
+    """Cached simplify keyed on the expression's string form."""
+    return simplify(_sympify_str(expr_str))
+
+
+@lru_cache(maxsize=256)
+def _compiled_function(expr_str, var):
+    """
+    lambdify() parses the expression and execs generated source on every
+    call; cache the compiled function per (expression, variable) pair.
+    The numpy backend lets one call evaluate a whole array of points,
+    and cse=True factors repeated subexpressions out of the generated
+    code, which matters for the large trees differentiate and
+    taylor_series can produce.
+    """
+    return lambdify(_sym(var), _sympify_str(expr_str), modules=["numpy"], cse=True)
+
+
+@lru_cache(maxsize=256)
+def _compiled_with_derivative(expr_str, var):
+    """Compiled (f, f') pair for Newton-style iteration, cached like above."""
+    x = _sym(var)
+    f_expr = _sympify_str(expr_str)
+    return (
+        lambdify(x, f_expr, modules=["math"]),
+        lambdify(x, diff(f_expr, x), modules=["math"]),
+    )
+
+
 class MathSolver:
     """
     High-level interface for common mathematical tasks.
@@ -69,7 +205,7 @@ class MathSolver:
             (2.0, 1.0)
         """
         if a == 0:
-            return solve_linear(b, c)
+            return MathSolver.solve_linear(b, c)
         
         discriminant = b**2 - 4*a*c
         
@@ -84,7 +220,30 @@ class MathSolver:
             root1 = (-b + cmath.sqrt(discriminant)) / (2*a)
             root2 = (-b - cmath.sqrt(discriminant)) / (2*a)
             return root1, root2
-    
+
+    @staticmethod
+    def solve_quadratic_batch(a, b, c):
+        """
+        Solve many quadratics a x² + b x + c = 0 at once.
+
+        Args:
+            a, b, c: Array-likes of coefficients, broadcast together,
+                with a nonzero.
+
+        Returns:
+            tuple: Two root arrays; complex where the discriminant is
+            negative.
+        """
+        import numpy as np
+
+        a = np.asarray(a)
+        b = np.asarray(b)
+        disc = b * b - 4 * a * np.asarray(c)
+        # emath.sqrt switches to the complex domain only when needed.
+        sqrt_disc = np.emath.sqrt(disc)
+        denom = 2 * a
+        return (-b + sqrt_disc) / denom, (-b - sqrt_disc) / denom
+
     @staticmethod
     def mean(data):
         """
@@ -100,7 +259,13 @@ class MathSolver:
             >>> mean([1, 2, 3, 4, 5])
             3.0
         """
-        return sum(data) / len(data)
+        try:
+            import numpy as np
+        except ImportError:
+            # fsum is a correctly-rounded C accumulation, the stdlib
+            # analogue of numpy's pairwise summation.
+            return math.fsum(data) / len(data)
+        return float(np.asarray(data, dtype=np.float64).mean())
 
     @staticmethod
     def median(data):
@@ -117,13 +282,18 @@ class MathSolver:
             >>> median([1, 2, 3, 4, 5])
             3.0
         """
-        sorted_data = sorted(data)
-        n = len(sorted_data)
-        
+        import numpy as np
+
+        a = np.asarray(data, dtype=np.float64)
+        n = a.size
+        k = n // 2
+
+        # Introselect partition is O(n); a full sort would be O(n log n).
         if n % 2 == 0:
-            return (sorted_data[n//2 - 1] + sorted_data[n//2]) / 2
+            part = np.partition(a, (k - 1, k))
+            return float((part[k - 1] + part[k]) / 2)
         else:
-            return sorted_data[n//2]
+            return float(np.partition(a, k)[k])
 
     @staticmethod
     def mode(data):
@@ -140,9 +310,23 @@ class MathSolver:
             >>> mode([1, 2, 2, 3, 4])
             [2]
         """
-        count = Counter(data)
-        max_count = max(count.values())
-        return [x for x, c in count.items() if c == max_count]
+        import numpy as np
+
+        try:
+            vals, counts = np.unique(np.asarray(data), return_counts=True)
+        except (TypeError, ValueError):
+            # Mixed or unorderable element types: fall back to hashing,
+            # collecting the maxima in a single sweep of the counts.
+            best = []
+            top = 0
+            for x, c in Counter(data).items():
+                if c > top:
+                    top = c
+                    best = [x]
+                elif c == top:
+                    best.append(x)
+            return best
+        return vals[counts == counts.max()].tolist()
 
     @staticmethod
     def variance(data, sample=True):
@@ -160,17 +344,15 @@ class MathSolver:
             >>> variance([1, 2, 3, 4, 5])
             2.5
         """
-        n = len(data)
-        if n < 2:
+        if len(data) < 2:
             return 0
-        
-        m = mean(data)
-        sum_sq = sum((x - m) ** 2 for x in data)
-        
-        if sample:
-            return sum_sq / (n - 1)
-        else:
-            return sum_sq / n
+        try:
+            import numpy as np
+        except ImportError:
+            m2, n = _welford(data)
+            return m2 / (n - 1 if sample else n)
+        a = np.asarray(data, dtype=np.float64)
+        return float(a.var(ddof=1 if sample else 0))
 
     @staticmethod
     def standard_deviation(data, sample=True):
@@ -188,7 +370,7 @@ class MathSolver:
             >>> standard_deviation([1, 2, 3, 4, 5])
             1.5811388300841898
         """
-        return math.sqrt(variance(data, sample))
+        return math.sqrt(MathSolver.variance(data, sample))
 
     @staticmethod
     def permutations(n, r):
@@ -208,7 +390,7 @@ class MathSolver:
         """
         if r > n or r < 0:
             return 0
-        return math.factorial(n) // math.factorial(n - r)
+        return math.perm(n, r)
 
     @staticmethod
     def combinations(n, r):
@@ -228,7 +410,7 @@ class MathSolver:
         """
         if r > n or r < 0:
             return 0
-        return math.factorial(n) // (math.factorial(r) * math.factorial(n - r))
+        return math.comb(n, r)
 
     @staticmethod
     def binomial_probability(n, k, p):
@@ -247,7 +429,54 @@ class MathSolver:
             >>> binomial_probability(5, 2, 0.5)
             0.3125
         """
-        return combinations(n, k) * (p ** k) * ((1 - p) ** (n - k))
+        if n > 1000 and 0 < p < 1:
+            # Log-space evaluation: math.comb(n, k) would build a huge
+            # exact integer only to be crushed by a tiny p**k anyway.
+            log_prob = (
+                math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+                + k * math.log(p) + (n - k) * math.log(1 - p)
+            )
+            return math.exp(log_prob)
+        return _binom_coeff(n, k) * (p ** k) * ((1 - p) ** (n - k))
+
+    @staticmethod
+    def binomial_pmf(n, p):
+        """
+        Full binomial distribution P(X = k) for k = 0..n in one pass.
+
+        Args:
+            n (int): Number of trials.
+            p (float): Probability of success on a single trial.
+
+        Returns:
+            numpy.ndarray: Array of n + 1 probabilities.
+
+        Example:
+            >>> binomial_pmf(2, 0.5)
+            array([0.25, 0.5 , 0.25])
+
+        Each term comes from the previous one via
+        P(k+1) = P(k) * (n-k)/(k+1) * p/(1-p), so the whole
+        distribution costs O(n) multiplies instead of n + 1
+        independent comb/power evaluations.
+        """
+        import numpy as np
+
+        out = np.zeros(n + 1)
+        if p <= 0:
+            out[0] = 1.0
+            return out
+        if p >= 1:
+            out[n] = 1.0
+            return out
+        q = 1.0 - p
+        ratio = p / q
+        c = q ** n
+        out[0] = c
+        for k in range(n):
+            c *= (n - k) / (k + 1) * ratio
+            out[k + 1] = c
+        return out
 
     @staticmethod
     def linear_regression(x, y):
@@ -265,24 +494,59 @@ class MathSolver:
             >>> linear_regression([1, 2, 3, 4, 5], [2, 4, 5, 4, 5])
             (0.6, 2.2)
         """
-        n = len(x)
-        if n != len(y):
+        import numpy as np
+
+        if len(x) != len(y):
             raise ValueError("x and y must have the same length")
-        
-        x_mean = mean(x)
-        y_mean = mean(y)
-        
-        numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-        
+
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        x_mean = x.mean()
+        y_mean = y.mean()
+
+        dx = x - x_mean
+        numerator = dx.dot(y - y_mean)
+        denominator = dx.dot(dx)
+
         if denominator == 0:
-            return 0, y_mean
-        
-        slope = numerator / denominator
-        intercept = y_mean - slope * x_mean
-        
+            return 0, float(y_mean)
+
+        slope = float(numerator / denominator)
+        intercept = float(y_mean - slope * x_mean)
+
         return slope, intercept
 
+    @staticmethod
+    def linear_regression_batch(X, y):
+        """
+        Least-squares fit against a full design matrix.
+
+        Args:
+            X (array-like): Design matrix of shape (n, p); include a
+                column of ones for an intercept term.
+            y (array-like): Observed values, length n.
+
+        Returns:
+            numpy.ndarray: Coefficient vector beta of length p.
+
+        Example:
+            >>> X = np.stack([np.ones(5), np.arange(1.0, 6.0)], axis=1)
+            >>> linear_regression_batch(X, [2, 4, 5, 4, 5])
+            array([2.2, 0.6])
+
+        Solves the normal equations (X.T @ X) beta = X.T @ y, so the
+        whole fit is two BLAS products and one small dense solve
+        rather than per-element Python accumulation.
+        """
+        import numpy as np
+
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if X.shape[0] != y.shape[0]:
+            raise ValueError("X and y must have the same number of rows")
+        return np.linalg.solve(X.T @ X, X.T @ y)
+
     @staticmethod
     def generate_primes(n):
         """
@@ -298,13 +562,27 @@ class MathSolver:
             >>> generate_primes(5)
             [2, 3, 5, 7, 11]
         """
-        primes = []
-        num = 2
-        while len(primes) < n:
-            if is_prime(num):
-                primes.append(num)
-            num += 1
-        return primes
+        import numpy as np
+
+        if n <= 0:
+            return []
+
+        # Upper bound on the n-th prime: n (ln n + ln ln n) for n >= 6.
+        if n < 6:
+            upper = 15
+        else:
+            upper = int(n * (math.log(n) + math.log(math.log(n)))) + 10
+
+        while True:
+            sieve = np.ones(upper, dtype=bool)
+            sieve[:2] = False
+            for i in range(2, math.isqrt(upper - 1) + 1):
+                if sieve[i]:
+                    sieve[i * i::i] = False
+            primes = np.flatnonzero(sieve)
+            if primes.size >= n:
+                return primes[:n].tolist()
+            upper *= 2
 
     @staticmethod
     def prime_factorization(n):
@@ -321,15 +599,33 @@ class MathSolver:
             >>> prime_factorization(60)
             {2: 2, 3: 1, 5: 1}
         """
+        # 0 and negatives would loop forever in the peel below
+        # (0 % p == 0 and 0 // p == 0); 1 simply has no factors.
+        if n < 2:
+            return {}
+
         factors = {}
-        d = 2
-        while d * d <= n:
+        for p in (2, 3, 5):
+            while n % p == 0:
+                factors[p] = factors.get(p, 0) + 1
+                n //= p
+
+        # 2,3,5-wheel: only ~8/30 of integers survive as candidates.
+        d = 7
+        i = 0
+        while d * d <= n and d < _TRIAL_LIMIT:
             while n % d == 0:
                 factors[d] = factors.get(d, 0) + 1
                 n //= d
-            d += 1
+            d += _WHEEL[i]
+            i = (i + 1) & 7
+
         if n > 1:
-            factors[n] = factors.get(n, 0) + 1
+            if d * d > n:
+                # Trial division finished: the residual is prime.
+                factors[n] = factors.get(n, 0) + 1
+            else:
+                _split_residual(n, factors)
         return factors
 
     @staticmethod
@@ -349,15 +645,27 @@ class MathSolver:
         """
         if n <= 1:
             return False
-        
-        divisors = [1]
-        for i in range(2, int(math.sqrt(n)) + 1):
+
+        if n % 2 == 0:
+            # Euler: every even perfect number is 2^(p-1) (2^p - 1)
+            # with 2^p - 1 prime, so one bit-isolate plus a primality
+            # test settles the even case in O(log n).
+            m = n & -n
+            return n == m * (2 * m - 1) and MathSolver.is_prime(2 * m - 1)
+
+        # No odd perfect number is known, but none is ruled out either:
+        # stream the (odd-only) divisor sum with early abort.
+        total = 1
+        for i in range(3, math.isqrt(n) + 1, 2):
             if n % i == 0:
-                divisors.append(i)
-                if i != n // i:
-                    divisors.append(n // i)
-        
-        return sum(divisors) == n
+                total += i
+                partner = n // i
+                if partner != i:
+                    total += partner
+                if total > n:
+                    return False
+
+        return total == n
 
     @staticmethod
     def simplify_fraction(numerator, denominator):
@@ -378,7 +686,7 @@ class MathSolver:
         if denominator == 0:
             raise ValueError("Denominator cannot be zero")
         
-        common_divisor = gcd(numerator, denominator)
+        common_divisor = MathSolver.gcd(numerator, denominator)
         return numerator // common_divisor, denominator // common_divisor
 
     @staticmethod
@@ -397,7 +705,10 @@ class MathSolver:
             >>> modular_inverse(3, 11)
             4
         """
-        return mod_inverse(a, m)
+        # Built-in pow(a, -1, m) raises ValueError when no inverse
+        # exists, matching sympy.mod_inverse, without sympy's
+        # assumption-system dispatch on plain ints.
+        return pow(a, -1, m)
 
     @staticmethod
     def solve_cubic(a, b, c, d):
@@ -417,42 +728,44 @@ class MathSolver:
             >>> solve_cubic(1, -6, 11, -6)
             (3.0, 2.0, 1.0)
         """
+        import numpy as np
+
         if a == 0:
-            return solve_quadratic(b, c, d)
-        
-        # Normalize the equation: x³ + px² + qx + r = 0
-        p = b / a
-        q = c / a
-        r = d / a
-        
-        # Depressed cubic: y³ + my + n = 0 where y = x + p/3
-        p3 = p / 3
-        m = q - p * p3
-        n = 2 * p3**3 - p3 * q + r
-        
-        # Cardano's formula
-        discriminant = (n/2)**2 + (m/3)**3
-        
-        if discriminant > 0:
-            u = (-n/2 + math.sqrt(discriminant))**(1/3)
-            v = (-n/2 - math.sqrt(discriminant))**(1/3)
-            y1 = u + v
-            roots = [y1 - p3]
-        elif discriminant == 0:
-            u = (-n/2)**(1/3)
-            y1 = 2 * u
-            y2 = -u
-            roots = [y1 - p3, y2 - p3, y2 - p3]
-        else:
-            rho = math.sqrt((-m/3)**3)
-            theta = math.acos(-n/(2*rho))
-            u = 2 * math.pow(rho, 1/3)
-            y1 = u * math.cos(theta/3)
-            y2 = u * math.cos((theta + 2*math.pi)/3)
-            y3 = u * math.cos((theta + 4*math.pi)/3)
-            roots = [y1 - p3, y2 - p3, y3 - p3]
-        
-        return tuple(roots)
+            return MathSolver.solve_quadratic(b, c, d)
+
+        # Companion-matrix eigensolve handles every discriminant case;
+        # the old Cardano code took the wrong real cube root for
+        # negative radicands via (-x)**(1/3).
+        roots = np.roots([a, b, c, d])
+        return tuple(
+            float(r.real) if abs(r.imag) < 1e-12 else complex(r)
+            for r in roots
+        )
+
+    @staticmethod
+    def solve_cubic_batch(coeffs):
+        """
+        Solve many cubics a x³ + b x² + c x + d = 0 at once.
+
+        Args:
+            coeffs: Array-like of shape (m, 4), one (a, b, c, d) row per
+                equation, with a != 0.
+
+        Returns:
+            numpy.ndarray: Complex roots, shape (m, 3).
+        """
+        import numpy as np
+
+        coeffs = np.asarray(coeffs, dtype=np.float64)
+        monic = coeffs[:, 1:] / coeffs[:, :1]
+
+        # Stacked companion matrices -> one batched eigensolve.
+        m = coeffs.shape[0]
+        companion = np.zeros((m, 3, 3))
+        companion[:, 1, 0] = 1.0
+        companion[:, 2, 1] = 1.0
+        companion[:, :, 2] = -monic[:, ::-1]
+        return np.linalg.eigvals(companion)
 
     @staticmethod
     def matrix_determinant(matrix):
@@ -469,24 +782,55 @@ class MathSolver:
             >>> matrix_determinant([[1, 2], [3, 4]])
             -2.0
         """
+        import numpy as np
+
         n = len(matrix)
-        
+
+        # Tiny inputs are cheaper inline than through LAPACK setup.
         if n == 1:
             return matrix[0][0]
         elif n == 2:
             return matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
-        else:
-            det = 0
-            for j in range(n):
-                minor = []
-                for i in range(1, n):
-                    row = []
-                    for k in range(n):
-                        if k != j:
-                            row.append(matrix[i][k])
-                    minor.append(row)
-                det += (-1) ** j * matrix[0][j] * matrix_determinant(minor)
-            return det
+
+        # Exact entries keep an exact determinant: float64 coercion
+        # silently rounds Fractions/Rationals and overflows huge ints,
+        # so those matrices go straight to the Bareiss path.
+        if all(isinstance(x, (int, Fraction, Rational)) for row in matrix for x in row):
+            return Matrix(matrix).det()
+
+        try:
+            A = np.asarray(matrix, dtype=np.float64)
+        except (TypeError, ValueError, OverflowError):
+            # Symbolic entries: sympy's det is fraction-free Bareiss
+            # elimination, still O(n^3) with no float rounding.
+            return Matrix(matrix).det()
+        sign, logdet = np.linalg.slogdet(A)
+        return float(sign * np.exp(logdet))
+
+    @staticmethod
+    def matrix_determinants_batch(stack):
+        """
+        Calculate determinants for a whole stack of matrices at once.
+
+        Args:
+            stack: Array-like of shape (k, n, n). Callers with many
+                small matrices should pre-stack them rather than loop —
+                LAPACK is dispatched once for the whole batch.
+
+        Returns:
+            numpy.ndarray: The k determinants.
+        """
+        import numpy as np
+
+        stack = np.ascontiguousarray(stack, dtype=np.float64)
+        if stack.shape[-1] == 2:
+            # Hand-vectorized 2x2: a ufunc chain beats LAPACK dispatch.
+            a = stack[..., 0, 0]
+            b = stack[..., 0, 1]
+            c = stack[..., 1, 0]
+            d = stack[..., 1, 1]
+            return a * d - b * c
+        return np.linalg.det(stack)
 
     @staticmethod
     def is_prime(n):
@@ -505,19 +849,30 @@ class MathSolver:
             >>> is_prime(15)
             False
         """
-        if n <= 1:
-            return False
-        if n <= 3:
-            return True
-        if n % 2 == 0 or n % 3 == 0:
+        if n < 2:
             return False
-        
-        i = 5
-        while i * i <= n:
-            if n % i == 0 or n % (i + 2) == 0:
+        for p in _MR_WITNESSES:
+            if n % p == 0:
+                return n == p
+
+        # Deterministic Miller-Rabin: O((log n)^3) bit operations via
+        # the C-implemented three-argument pow, instead of O(sqrt(n))
+        # trial divisions.
+        d = n - 1
+        s = 0
+        while d % 2 == 0:
+            d //= 2
+            s += 1
+        for a in _MR_WITNESSES:
+            x = pow(a, d, n)
+            if x == 1 or x == n - 1:
+                continue
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
                 return False
-            i += 6
-        
         return True
 
     @staticmethod
@@ -537,9 +892,7 @@ class MathSolver:
         """
         if n < 0:
             raise ValueError("Factorial is not defined for negative numbers")
-        if n == 0:
-            return 1
-        return n * factorial(n - 1)
+        return math.factorial(n)
 
     @staticmethod
     def fibonacci(n):
@@ -558,16 +911,46 @@ class MathSolver:
         """
         if n <= 0:
             return []
-        if n == 1:
-            return [0]
-        if n == 2:
-            return [0, 1]
-        
-        sequence = [0, 1]
-        for i in range(2, n):
-            sequence.append(sequence[i-1] + sequence[i-2])
-        
-        return sequence
+
+        # Extend the shared prefix only as far as this call needs;
+        # repeated calls reuse everything computed before.
+        while len(_FIB) < n:
+            _FIB.append(_FIB[-1] + _FIB[-2])
+
+        return _FIB[:n]
+
+    @staticmethod
+    def nth_fibonacci(n):
+        """
+        Calculate the n-th Fibonacci number (0-indexed) without building
+        the whole sequence.
+
+        Args:
+            n (int): The index of the Fibonacci number.
+
+        Returns:
+            int: The n-th Fibonacci number.
+
+        Example:
+            >>> nth_fibonacci(10)
+            55
+        """
+        if n < 0:
+            raise ValueError("Fibonacci is not defined for negative indices")
+
+        # Fast doubling: F(2k) = F(k) (2 F(k+1) - F(k)),
+        # F(2k+1) = F(k)^2 + F(k+1)^2 — O(log n) bignum multiplies.
+        def _fib_pair(k):
+            if k == 0:
+                return 0, 1
+            a, b = _fib_pair(k >> 1)
+            c = a * (2 * b - a)
+            d = a * a + b * b
+            if k & 1:
+                return d, c + d
+            return c, d
+
+        return _fib_pair(n)[0]
 
     @staticmethod
     def gcd(a, b):
@@ -585,9 +968,7 @@ class MathSolver:
             >>> gcd(54, 24)
             6
         """
-        while b:
-            a, b = b, a % b
-        return abs(a)
+        return math.gcd(a, b)
 
     @staticmethod
     def lcm(a, b):
@@ -605,13 +986,48 @@ class MathSolver:
             >>> lcm(12, 18)
             36
         """
-        return abs(a * b) // gcd(a, b) if a and b else 0
+        return math.lcm(a, b)
         
     @staticmethod
-    def simplify_expr(expr: Union[str, "sympy.Expr"]):
-        """Simplify a symbolic expression."""
-        expr = sympify(expr)
-        return simplify(expr)
+    def simplify_expr(expr: Union[str, "sympy.Expr"], strategy: str = "auto"):
+        """
+        Simplify a symbolic expression.
+
+        strategy selects the rewriter: "cancel", "factor", "expand" or
+        "simplify" apply that routine directly; the default "auto"
+        picks cheap targeted ones (factor for polynomials, cancel for
+        rational functions) and only falls back to the full heuristic
+        simplify() for everything else.
+        """
+        expr = _as_expr(expr)
+        if strategy == "auto":
+            try:
+                if expr.is_polynomial():
+                    return factor(expr)
+                if expr.is_rational_function():
+                    return cancel(expr)
+            except AttributeError:
+                pass  # non-Expr (e.g. Matrix); let simplify handle it
+            return simplify(expr)
+        routines = {
+            "cancel": cancel,
+            "factor": factor,
+            "expand": expand,
+            "simplify": simplify,
+        }
+        if strategy not in routines:
+            raise ValueError(f"Unknown strategy: {strategy!r}")
+        return routines[strategy](expr)
+
+    @staticmethod
+    def simplify_expr_cached(expr: Union[str, "sympy.Expr"]):
+        """
+        Like simplify_expr, but memoizes results by the expression's
+        string form. Opt in for workloads that simplify the same
+        expressions repeatedly (parameter sweeps, grading loops); for
+        one-shot user input the cache is pure overhead.
+        """
+        return _simplify_cached(expr if isinstance(expr, str) else str(expr))
 
     @staticmethod
     def solve_equation(
@@ -627,18 +1043,15 @@ class MathSolver:
         solve_equation("sin(x) - x/2", "x")
         """
         if isinstance(equation, str):
-            expr = sympify(equation)
-            equation = Eq(expr, 0)
+            equation = Eq(_as_expr(equation), 0)
         if isinstance(var, str):
-            var = symbols(var)
+            var = _sym(var)
         return solve(equation, var)
 
     @staticmethod
     def differentiate(expr: Union[str, "sympy.Expr"], var: str, order: int = 1):
         """Differentiate expr wrt var, possibly higher order."""
-        var_symbol = symbols(var)
-        expr = sympify(expr)
-        return diff(expr, var_symbol, order)
+        return diff(_as_expr(expr), _sym(var), order)
 
     @staticmethod
     def integrate(
@@ -648,8 +1061,8 @@ class MathSolver:
         upper: Optional[Number] = None,
     ):
         """Compute indefinite or definite integral."""
-        var_symbol = symbols(var)
-        expr = sympify(expr)
+        var_symbol = _sym(var)
+        expr = _as_expr(expr)
         if lower is None or upper is None:
             return integrate(expr, var_symbol)
         return integrate(expr, (var_symbol, lower, upper))
@@ -657,18 +1070,14 @@ class MathSolver:
     @staticmethod
     def compute_limit(expr: Union[str, "sympy.Expr"], var: str, point: Number, dir: str = "+"):
         """Compute limit of expr as var -> point (dir = '+' or '-')."""
-        var_symbol = symbols(var)
-        expr = sympify(expr)
-        return limit(expr, var_symbol, point, dir=dir)
+        return limit(_as_expr(expr), _sym(var), point, dir=dir)
 
     @staticmethod
     def taylor_series(expr: Union[str, "sympy.Expr"], var: str, a: Number = 0, order: int = 5):
         """
         Taylor series expansion of expr around x = a up to (var - a)**(order - 1).
         """
-        var_symbol = symbols(var)
-        expr = sympify(expr)
-        return series(expr, var_symbol, a, order)
+        return series(_as_expr(expr), _sym(var), a, order)
 
     @staticmethod
     def matrix_from_list(data: List[List[Number]]) -> Matrix:
@@ -705,12 +1114,17 @@ class MathSolver:
     ) -> Callable[[Number], float]:
         """
         Convert a sympy expression to a numeric Python function f(x).
-        Useful for plotting, root-finding, etc.
+        Useful for plotting, root-finding, etc. Scalars come back as
+        float; array arguments are evaluated vectorized and returned
+        as arrays.
         """
-        var_symbol = symbols(var)
-        expr = sympify(expr)
-        f = lambdify(var_symbol, expr, modules=["math"])
-        return lambda x: float(f(x))
+        f = _compiled_function(expr if isinstance(expr, str) else str(expr), var)
+
+        def _evaluate(x):
+            result = f(x)
+            return float(result) if isinstance(x, (int, float)) else result
+
+        return _evaluate
 
     @staticmethod
     def newton_raphson_root(
@@ -724,12 +1138,9 @@ class MathSolver:
         Numeric root finder using Newton–Raphson method.
         expr is treated as f(x) = 0.
         """
-        x_symbol = symbols(var)
-        f_expr = sympify(expr)
-        f_prime = diff(f_expr, x_symbol)
-
-        f = lambdify(x_symbol, f_expr, "math")
-        df = lambdify(x_symbol, f_prime, "math")
+        f, df = _compiled_with_derivative(
+            expr if isinstance(expr, str) else str(expr), var
+        )
 
         x = float(x0)
         for _ in range(max_iter):
@@ -761,8 +1172,8 @@ class MathSolver:
             >>> convert_timezone(dt, 'UTC', 'US/Eastern')
             datetime.datetime(2023, 1, 1, 7, 0, 0, tzinfo=<DstTzInfo 'US/Eastern' EST-1 day, 19:00:00 STD>)
         """
-        from_zone = pytz.timezone(from_tz)
-        to_zone = pytz.timezone(to_tz)
+        from_zone = _tz(from_tz)
+        to_zone = _tz(to_tz)
         
         if dt.tzinfo is None:
             dt = from_zone.localize(dt)
@@ -823,24 +1234,20 @@ class MathSolver:
             >>> working_days_calculator(start, end)
             6
         """
-        if holidays is None:
-            holidays = []
-        
-        # Create a rule for weekdays (Monday to Friday)
-        rule = rrule.rrule(
-            rrule.DAILY,
-            byweekday=[rrule.MO, rrule.TU, rrule.WE, rrule.TH, rrule.FR],
-            dtstart=start_date,
-            until=end_date
+        import numpy as np
+
+        holidays_arr = np.array(
+            [h.date() if hasattr(h, "date") else h for h in holidays or []],
+            dtype="datetime64[D]",
         )
-        
-        # Count working days excluding holidays
-        working_days = 0
-        for dt in rule:
-            if dt.date() not in holidays:
-                working_days += 1
-        
-        return working_days    
+
+        # busday_count runs the whole range in one C loop; the end date
+        # is exclusive, so push it one day out to keep it inclusive.
+        return int(np.busday_count(
+            np.datetime64(start_date.date()),
+            np.datetime64(end_date.date()) + np.timedelta64(1, "D"),
+            holidays=holidays_arr,
+        ))
 
 
 class DifferentialEquations:
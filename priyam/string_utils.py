@@ -5,6 +5,28 @@ String utilities for common string operations.
 import re
 import unicodedata
 
+# Compiled once; re.sub with a literal pattern pays a cache lookup (and
+# possible recompile) on every call.
+_RE_SEPS = re.compile(r"[-\s]+")
+
+# Deletion table equivalent to the old [^\w\s-] regex over ASCII: one
+# C pass per string instead of a regex scan. Valid because slugify's
+# input is ASCII after the NFKD step.
+_ASCII_STRIP = str.maketrans(
+    "", "",
+    "".join(
+        c for c in map(chr, range(128))
+        if not (c.isalnum() or c == "_" or c == "-" or c.isspace())
+    ),
+)
+
+# Built once; a frozenset gives O(1) membership checks instead of a
+# linear scan over a per-call list.
+_DEFAULT_EXCEPTIONS = frozenset([
+    "a", "an", "the", "and", "but", "or", "for", "nor",
+    "on", "at", "to", "from", "by", "of", "in",
+])
+
 def title_case_with_exceptions(text, exceptions=None):
     """
     Convert text to title case with exceptions for specific words.
@@ -21,18 +43,20 @@ def title_case_with_exceptions(text, exceptions=None):
         'The Lord of the Rings'
     """
     if exceptions is None:
-        exceptions = ["a", "an", "the", "and", "but", "or", "for", "nor", 
-                     "on", "at", "to", "from", "by", "of", "in"]
-    
+        exceptions = _DEFAULT_EXCEPTIONS
+    else:
+        exceptions = frozenset(e.lower() for e in exceptions)
+
     words = text.split()
-    result = []
-    
+    result = [None] * len(words)
+    last = len(words) - 1
+
     for i, word in enumerate(words):
-        if i == 0 or i == len(words) - 1 or word.lower() not in exceptions:
-            result.append(word.capitalize())
+        if i == 0 or i == last or word.lower() not in exceptions:
+            result[i] = word.capitalize()
         else:
-            result.append(word.lower())
-    
+            result[i] = word.lower()
+
     return " ".join(result)
 
 def reverse_words(text):
@@ -49,8 +73,9 @@ def reverse_words(text):
         >>> reverse_words("Hello World")
         'World Hello'
     """
-    words = text.split()
-    return " ".join(reversed(words))
+    # Slicing builds the reversed list directly; join over the
+    # reversed() iterator has to materialize it anyway, one step later.
+    return " ".join(text.split()[::-1])
 
 def slugify(text, separator="-"):
     """
@@ -67,14 +92,16 @@ def slugify(text, separator="-"):
         >>> slugify("Hello World!")
         'hello-world'
     """
-    # Normalize unicode characters
-    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
-    
+    # Normalize unicode characters; pure-ASCII input (the common case
+    # for URL slugs) skips the NFKD decompose/encode round-trip
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+
     # Convert to lowercase and remove special characters
-    text = re.sub(r"[^\w\s-]", "", text.lower())
-    
+    text = text.lower().translate(_ASCII_STRIP)
+
     # Replace spaces and hyphens with the separator
-    text = re.sub(r"[-\s]+", separator, text)
-    
+    text = _RE_SEPS.sub(separator, text)
+
     # Remove leading/trailing separators
     return text.strip(separator)
\ No newline at end of file